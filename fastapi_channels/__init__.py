@@ -1,10 +1,25 @@
 """FastAPI Channels - WebSocket connection management for FastAPI applications."""
 
-from fastapi_channels.config import WSConfig
-from fastapi_channels.connections import Connection, ConnectionManager, ConnectionRegistry
-from fastapi_channels.connections.manager import get_manager
-from fastapi_channels.consumer import BaseConsumer
-from fastapi_channels.exceptions import BaseError
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from fastapi_channels.config import WSConfig
+    from fastapi_channels.connections import Connection, ConnectionManager, ConnectionRegistry
+    from fastapi_channels.connections.manager import get_manager
+    from fastapi_channels.consumer import BaseConsumer
+    from fastapi_channels.exceptions import BaseError
+
+# Public names resolved on first access (PEP 562) so importing the package stays cheap
+_LAZY_IMPORTS = {
+    "BaseConsumer": "fastapi_channels.consumer",
+    "BaseError": "fastapi_channels.exceptions",
+    "Connection": "fastapi_channels.connections",
+    "ConnectionManager": "fastapi_channels.connections",
+    "ConnectionRegistry": "fastapi_channels.connections",
+    "WSConfig": "fastapi_channels.config",
+    "get_manager": "fastapi_channels.connections.manager",
+}
 
 __all__ = [
     "BaseConsumer",
@@ -15,3 +30,17 @@ __all__ = [
     "WSConfig",
     "get_manager",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
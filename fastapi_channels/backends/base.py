@@ -1,8 +1,13 @@
-import asyncio
-import uuid
+import itertools
+import os
 from abc import ABC, abstractmethod
 from typing import Any, TypedDict
 
+from fastapi_channels.utils.encoding import loads
+
+# Process-wide sequence for channel names; next() on a count is atomic under the GIL
+_channel_counter = itertools.count(1)
+
 
 class CleanupStats(TypedDict):
     connections_removed: int
@@ -53,7 +58,7 @@ class BaseBackend(ABC):
         """
 
     @abstractmethod
-    async def subscribe(self, channel: str) -> None:
+    async def subscribe(self, channel: str) -> Any:
         """Subscribe to receive messages from a channel.
 
         Parameters
@@ -61,6 +66,11 @@ class BaseBackend(ABC):
         channel : str
             Channel name to subscribe to
 
+        Returns
+        -------
+        Any
+            Backend-specific subscription handle, or None if the backend has none
+
         Notes
         -----
         After subscribing, messages sent to this channel will be
@@ -142,6 +152,52 @@ class BaseBackend(ABC):
 
         """
 
+    async def group_send_many(
+        self, group: str, messages: list[dict[str, Any]], exclude_channel: str | None = None
+    ) -> None:
+        """Send several messages, in order, to all channels in a group.
+
+        Parameters
+        ----------
+        group : str
+            Target group name
+        messages : list[dict[str, Any]]
+            Message payloads to deliver, in order
+        exclude_channel : str | None, optional
+            Channel to exclude from delivery. Default: None
+
+        Notes
+        -----
+        This default calls group_send() once per message. Networked backends should
+        override it to batch the deliveries (e.g. one Redis pipeline).
+
+        """
+        for message in messages:
+            await self.group_send(group, message, exclude_channel=exclude_channel)
+
+    async def group_send_raw(
+        self, group: str, payload: bytes, exclude_channel: str | None = None
+    ) -> None:
+        """Send a pre-encoded JSON message to all channels in a group.
+
+        Parameters
+        ----------
+        group : str
+            Target group name
+        payload : bytes
+            UTF-8 JSON encoding of the message payload
+        exclude_channel : str | None, optional
+            Channel to exclude from delivery. Default: None
+
+        Notes
+        -----
+        Backends that report supports_raw_broadcast() deliver the bytes without
+        re-serializing them. This default decodes the payload once and falls back
+        to group_send().
+
+        """
+        await self.group_send(group, loads(payload), exclude_channel=exclude_channel)
+
     @abstractmethod
     async def cleanup(self) -> None:
         """Clean up backend resources and connections.
@@ -227,17 +283,22 @@ class BaseBackend(ABC):
         Returns
         -------
         str
-            Unique channel name with timestamp and random suffix
+            Unique channel name with a random component and a sequence number
 
         Examples
         --------
         >>> await backend.new_channel()
-        'channel.1640995200000.a1b2c3d4'
+        'channel.a1b2c3d4.1'
         >>> await backend.new_channel("ws.user")
-        'ws.user.1640995200000.e5f6g7h8'
+        'ws.user.e5f6a7b8.2'
+
+        Notes
+        -----
+        The sequence number makes names unique within the process; the random
+        component keeps them distinct across restarts and server instances.
 
         """
-        return f"{prefix}.{int(asyncio.get_event_loop().time() * 1000)}.{uuid.uuid4().hex[:8]}"
+        return f"{prefix}.{os.urandom(4).hex()}.{next(_channel_counter)}"
 
     @abstractmethod
     async def registry_add_connection(
@@ -245,7 +306,7 @@ class BaseBackend(ABC):
         connection_id: str,
         user_id: str | None,
         metadata: dict[str, Any],
-        groups: set[str],
+        groups: frozenset[str],
         heartbeat_timeout: float,
     ) -> None:
         """Add a WebSocket connection to the registry.
@@ -258,7 +319,7 @@ class BaseBackend(ABC):
             User identifier if authenticated, None for anonymous
         metadata : dict[str, Any]
             Additional connection metadata (IP, user agent, etc.)
-        groups : set[str]
+        groups : frozenset[str]
             Initial groups the connection belongs to
         heartbeat_timeout : float
             Heartbeat timeout in seconds
@@ -289,20 +350,23 @@ class BaseBackend(ABC):
         """
 
     @abstractmethod
-    async def registry_update_groups(self, connection_id: str, groups: set[str]) -> None:
+    async def registry_update_groups(self, connection_id: str, groups: frozenset[str]) -> None:
         """Update the groups a connection belongs to.
 
         Parameters
         ----------
         connection_id : str
             Connection identifier to update
-        groups : set[str]
+        groups : frozenset[str]
             New set of groups for the connection
 
         Notes
         -----
         Used when connections join/leave groups dynamically.
         Maintains consistency between local state and registry.
+        Group sets cross this interface as frozensets: callers holding a mutable
+        set wrap it with frozenset() at the boundary, so implementations may keep
+        or hash the value directly (e.g. as a cache key) without copying.
 
         """
 
@@ -326,7 +390,7 @@ class BaseBackend(ABC):
         # No-op for backends without TTL (e.g., memory backend)
 
     @abstractmethod
-    async def registry_get_connection_groups(self, connection_id: str) -> set[str]:
+    async def registry_get_connection_groups(self, connection_id: str) -> frozenset[str]:
         """Get all groups a connection belongs to.
 
         Parameters
@@ -336,13 +400,14 @@ class BaseBackend(ABC):
 
         Returns
         -------
-        set[str]
-            Set of group names the connection belongs to
+        frozenset[str]
+            Read-only set of group names the connection belongs to
 
         Notes
         -----
         Used for cleanup when connections disconnect.
         Returns empty set if connection not found.
+        Read-only so backends can return stored state without a defensive copy.
 
         """
 
@@ -363,7 +428,7 @@ class BaseBackend(ABC):
         """
 
     @abstractmethod
-    async def registry_get_user_connections(self, user_id: str) -> set[str]:
+    async def registry_get_user_connections(self, user_id: str) -> frozenset[str]:
         """Get all connection IDs for a specific user.
 
         Parameters
@@ -373,8 +438,8 @@ class BaseBackend(ABC):
 
         Returns
         -------
-        set[str]
-            Set of connection IDs for the user
+        frozenset[str]
+            Connection IDs for the user
 
         Notes
         -----
@@ -388,7 +453,7 @@ class BaseBackend(ABC):
         connection_id: str,
         user_id: str | None,
         metadata: dict[str, Any],
-        groups: set[str],
+        groups: frozenset[str],
         heartbeat_timeout: float,
         max_connections: int,
     ) -> bool:
@@ -402,7 +467,7 @@ class BaseBackend(ABC):
             User identifier if authenticated, None for anonymous
         metadata : dict[str, Any]
             Additional connection metadata (IP, user agent, etc.)
-        groups : set[str]
+        groups : frozenset[str]
             Initial groups the connection belongs to
         heartbeat_timeout : float
             Heartbeat timeout in seconds
@@ -462,6 +527,22 @@ class BaseBackend(ABC):
         """
         return False
 
+    def supports_raw_broadcast(self) -> bool:
+        """Check if backend can fan out pre-encoded JSON bytes directly.
+
+        Returns
+        -------
+        bool
+            True if group_send_raw() delivers payload bytes without decoding them
+
+        Notes
+        -----
+        Callers holding an already encoded message use this to pick between
+        group_send_raw() and group_send().
+
+        """
+        return False
+
     async def cleanup_stale_connections(
         self, server_instance_id: str, timeout: float | None = 30
     ) -> CleanupStats:
@@ -1,11 +1,15 @@
 import asyncio
+import base64
+import logging
 from collections import defaultdict
 from typing import Any
 
-from fastapi_channels.utils import run_with_concurrency_limit
+from fastapi_channels.utils.encoding import TextFrame, dumps_bytes
 
 from .base import BaseBackend
 
+logger = logging.getLogger(__name__)
+
 
 class MemoryBackend(BaseBackend):
     """In-memory channel layer backend for single-server WebSocket deployments.
@@ -19,11 +23,16 @@ class MemoryBackend(BaseBackend):
     - Channel subscriptions and message queues
     - Group membership mappings
     - Connection registry with user mappings
-    - Thread-safe operations using asyncio locks
+
+    No locks are used: every operation below mutates plain dicts and sets without
+    awaiting in between, so each one runs atomically with respect to other
+    coroutines on the same event loop.
 
     Parameters
     ----------
-    None - uses default in-memory storage
+    max_queue_depth : int, optional
+        Maximum size of each subscriber queue created by subscribe(). 0 means
+        unbounded. Default: 0
 
     Examples
     --------
@@ -43,12 +52,11 @@ class MemoryBackend(BaseBackend):
 
     """
 
-    def __init__(self):
+    def __init__(self, max_queue_depth: int = 0):
+        self.max_queue_depth = max_queue_depth
         self.groups: dict[str, set[str]] = {}
         self.subscriptions: dict[str, set[str]] = {}
-        self._lock = asyncio.Lock()
-        self.channels: dict[str, asyncio.Queue] = {}
-        self.listeners: dict[str, set[asyncio.Queue]] = defaultdict(set)
+        self.listeners: dict[str, set[asyncio.Queue]] = {}
         self._registry_connections: set[str] = set()
         self._registry_connection_data: dict[str, dict[str, Any]] = {}
         self._registry_user_connections: dict[str, set[str]] = defaultdict(set)
@@ -65,15 +73,33 @@ class MemoryBackend(BaseBackend):
 
         Notes
         -----
-        Message is delivered asynchronously to all channel subscribers.
+        Message is enqueued with put_nowait to all channel subscribers. Nothing is
+        awaited, so the subscriber set is iterated in place without a copy.
         If channel has no subscribers, message is silently dropped.
+        Subscribers whose queue is full miss the message and a warning is logged.
 
         """
-        if channel in self.listeners:
-            for queue in self.listeners[channel].copy():
-                await queue.put(message)
+        listeners = self.listeners.get(channel)
+        if not listeners:
+            return
+
+        dropped = 0
+        for queue in listeners:
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                dropped += 1
 
-    async def subscribe(self, channel: str) -> None:
+        if dropped:
+            logger.warning(
+                "Dropped message for %d/%d full subscriber queues on channel %s",
+                dropped,
+                len(listeners),
+                channel,
+                extra={"channel": channel, "component": "memory_backend.publish"},
+            )
+
+    async def subscribe(self, channel: str) -> asyncio.Queue:
         """Subscribe to receive messages from a channel.
 
         Parameters
@@ -81,36 +107,47 @@ class MemoryBackend(BaseBackend):
         channel : str
             Channel name to subscribe to
 
+        Returns
+        -------
+        asyncio.Queue
+            New queue, bounded by max_queue_depth, that receives the channel's messages
+
         Notes
         -----
-        Creates a message queue for the channel if it doesn't exist.
-        Multiple subscriptions to the same channel share the same queue.
+        Each call registers its own queue, so multiple subscribers to the same
+        channel each receive every message.
 
         """
-        if channel not in self.channels:
-            self.channels[channel] = asyncio.Queue()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_queue_depth)
+        self.listeners.setdefault(channel, set()).add(queue)
+        return queue
 
-        queue = self.channels[channel]
-        self.listeners[channel].add(queue)
-
-    async def unsubscribe(self, channel: str) -> None:
+    async def unsubscribe(self, channel: str, queue: asyncio.Queue | None = None) -> None:
         """Unsubscribe from a channel.
 
         Parameters
         ----------
         channel : str
             Channel name to unsubscribe from
+        queue : asyncio.Queue | None, optional
+            Subscriber queue returned by subscribe(). Default: None (remove all subscribers)
 
         Notes
         -----
-        Removes the channel's message queue and all listeners.
-        Channel becomes unavailable for messaging after unsubscribe.
+        Only the given subscriber is removed; the channel entry is dropped once
+        its last subscriber is gone.
 
         """
-        if channel in self.channels:
-            queue = self.channels[channel]
-            self.listeners[channel].discard(queue)
-            del self.channels[channel]
+        listeners = self.listeners.get(channel)
+        if listeners is None:
+            return
+
+        if queue is None:
+            listeners.clear()
+        else:
+            listeners.discard(queue)
+        if not listeners:
+            del self.listeners[channel]
 
     async def group_add(self, group: str, channel: str) -> None:
         """Add a channel to a messaging group.
@@ -124,14 +161,10 @@ class MemoryBackend(BaseBackend):
 
         Notes
         -----
-        Thread-safe operation using asyncio lock.
         Creates group if it doesn't exist.
 
         """
-        async with self._lock:
-            if group not in self.groups:
-                self.groups[group] = set()
-            self.groups[group].add(channel)
+        self.groups.setdefault(group, set()).add(channel)
 
     async def group_discard(self, group: str, channel: str) -> None:
         """Remove a channel from a messaging group.
@@ -145,20 +178,17 @@ class MemoryBackend(BaseBackend):
 
         Notes
         -----
-        Thread-safe operation. Removes empty groups automatically.
+        Removes empty groups automatically.
 
         """
-        async with self._lock:
-            if group in self.groups:
-                self.groups[group].discard(channel)
-                if not self.groups[group]:
-                    del self.groups[group]
-
-    def _get_group_channels(self, group: str) -> set[str]:
-        return self.groups.get(group, set()).copy()
+        channels = self.groups.get(group)
+        if channels is not None:
+            channels.discard(channel)
+            if not channels:
+                del self.groups[group]
 
     async def group_channels(self, group: str) -> set[str]:
-        """Return thread-safe copy of channels in a group.
+        """Return a copy of the channels in a group.
 
         Parameters
         ----------
@@ -171,8 +201,7 @@ class MemoryBackend(BaseBackend):
             Set of channel names in the group
 
         """
-        async with self._lock:
-            return self._get_group_channels(group)
+        return set(self.groups.get(group, ()))
 
     async def group_send(
         self, group: str, message: dict[str, Any], exclude_channel: str | None = None
@@ -190,51 +219,89 @@ class MemoryBackend(BaseBackend):
 
         Notes
         -----
-        Publishes message to each channel in the group concurrently.
+        The message is encoded once into a ready-to-send frame (JSON text, or the
+        decoded bytes when it carries binary_data) and that same frame is put
+        directly into every subscriber queue, without spawning a task per channel.
+        Subscribers therefore receive a str or bytes frame rather than a dict; text
+        frames are TextFrame instances carrying their byte length.
         Logs warnings for any failed deliveries but doesn't raise exceptions.
         If exclude_channel is provided, that channel will not receive the message.
 
         """
-        channels = self._get_group_channels(group)
-        if not channels:
+        if group not in self.groups:
             return
 
-        if exclude_channel:
-            channels = {ch for ch in channels if ch != exclude_channel}
-            if not channels:
-                return
+        if "binary_data" in message:
+            frame: str | bytes = base64.b64decode(message["binary_data"])
+        else:
+            encoded = dumps_bytes(message)
+            frame = TextFrame(encoded.decode(), len(encoded))
+        self._put_group_frame(group, frame, exclude_channel)
+
+    async def group_send_raw(
+        self, group: str, payload: bytes, exclude_channel: str | None = None
+    ) -> None:
+        """Send a pre-encoded JSON message to all channels in a group.
+
+        Parameters
+        ----------
+        group : str
+            Target group name
+        payload : bytes
+            UTF-8 JSON encoding of the message payload
+        exclude_channel : str | None, optional
+            Channel to exclude from delivery. Default: None
 
-        tasks = [self.publish(channel, message) for channel in channels]
-        results = await run_with_concurrency_limit(
-            tasks, max_concurrent=100, return_exceptions=True
-        )
+        Notes
+        -----
+        The payload is decoded to a text frame once and shared by every subscriber
+        queue, exactly as group_send() does after encoding.
 
-        # Log any exceptions that occurred during publishing
+        """
+        if group not in self.groups:
+            return
+        self._put_group_frame(group, TextFrame(payload.decode(), len(payload)), exclude_channel)
+
+    def _put_group_frame(self, group: str, frame: str | bytes, exclude_channel: str | None) -> None:
+        channels = self.groups.get(group)
+        if not channels:
+            return
+
+        total_channels = 0
         failed_channels = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                failed_channels.append(list(channels)[i])
+        for channel in channels:
+            if channel == exclude_channel:
+                continue
+            total_channels += 1
+            delivered = True
+            for queue in self.listeners.get(channel, ()):
+                try:
+                    queue.put_nowait(frame)
+                except asyncio.QueueFull:
+                    delivered = False
+            if not delivered:
+                failed_channels.append(channel)
 
         if failed_channels:
-            import logging
-
-            logger = logging.getLogger(__name__)
             logger.warning(
                 "Failed to publish message to %d/%d channels in group %s",
                 len(failed_channels),
-                len(channels),
+                total_channels,
                 group,
                 extra={
                     "group": group,
-                    "total_channels": len(channels),
+                    "total_channels": total_channels,
                     "failed_channels": failed_channels,
                     "component": "memory_backend.group_send",
                 },
             )
 
     async def get_message(
-        self, channel: str, timeout: float | None = None
-    ) -> dict[str, Any] | None:
+        self,
+        channel: str,
+        timeout: float | None = None,
+        queue: asyncio.Queue | None = None,
+    ) -> dict[str, Any] | str | bytes | None:
         """Get next message from channel with optional timeout.
 
         Parameters
@@ -243,24 +310,40 @@ class MemoryBackend(BaseBackend):
             Channel name to receive from
         timeout : float | None, optional
             Maximum wait time in seconds. Default: None (wait indefinitely)
+        queue : asyncio.Queue | None, optional
+            Subscriber queue returned by subscribe(). Required when the channel
+            has several subscribers. Default: None (use the channel's only queue)
 
         Returns
         -------
-        dict[str, Any] | None
-            Next message from channel, or None if timeout exceeded
+        dict[str, Any] | str | bytes | None
+            Next message from channel (a pre-encoded frame if it came from
+            group_send), or None if timeout exceeded
 
         Raises
         ------
         asyncio.TimeoutError
             If timeout is exceeded (handled internally)
+        ValueError
+            If queue is omitted and the channel has several subscribers
 
         """
-        if channel not in self.channels:
-            return None
-
-        return await asyncio.wait_for(self.channels[channel].get(), timeout=timeout)
-
-    async def receive(self, channel: str, timeout: float | None = None) -> dict[str, Any] | None:
+        if queue is None:
+            listeners = self.listeners.get(channel)
+            if not listeners:
+                return None
+            if len(listeners) > 1:
+                raise ValueError(
+                    f"Channel {channel!r} has {len(listeners)} subscribers; "
+                    "pass the queue returned by subscribe()"
+                )
+            (queue,) = listeners
+
+        return await asyncio.wait_for(queue.get(), timeout=timeout)
+
+    async def receive(
+        self, channel: str, timeout: float | None = None
+    ) -> dict[str, Any] | str | bytes | None:
         """Receive next message from channel (alias for get_message).
 
         Parameters
@@ -272,8 +355,9 @@ class MemoryBackend(BaseBackend):
 
         Returns
         -------
-        dict[str, Any] | None
-            Next message from channel, or None if timeout exceeded
+        dict[str, Any] | str | bytes | None
+            Next message from channel (a pre-encoded frame if it came from
+            group_send), or None if timeout exceeded
 
         """
         return await self.get_message(channel, timeout)
@@ -281,10 +365,9 @@ class MemoryBackend(BaseBackend):
     async def cleanup(self) -> None:
         """Clean up all in-memory resources and connections.
 
-        Clears all channels, listeners, groups, and registry data.
+        Clears all listeners, groups, and registry data.
         Should be called during application shutdown.
         """
-        self.channels.clear()
         self.listeners.clear()
         await self.flush()
 
@@ -294,16 +377,33 @@ class MemoryBackend(BaseBackend):
         Removes all groups, subscriptions, and registry data.
         Used primarily for testing and development.
         """
-        async with self._lock:
-            self.groups.clear()
-            self.subscriptions.clear()
+        self.groups.clear()
+        self.subscriptions.clear()
+
+    def _registry_insert(
+        self,
+        connection_id: str,
+        user_id: str | None,
+        metadata: dict[str, Any],
+        groups: frozenset[str],
+        heartbeat_timeout: float,
+    ) -> None:
+        self._registry_connections.add(connection_id)
+        self._registry_connection_data[connection_id] = {
+            "user_id": user_id,
+            "metadata": metadata,
+            "groups": frozenset(groups),
+            "heartbeat_timeout": heartbeat_timeout,
+        }
+        if user_id:
+            self._registry_user_connections[user_id].add(connection_id)
 
     async def registry_add_connection(
         self,
         connection_id: str,
         user_id: str | None,
         metadata: dict[str, Any],
-        groups: set[str],
+        groups: frozenset[str],
         heartbeat_timeout: float,
     ) -> None:
         """Add WebSocket connection to in-memory registry.
@@ -316,33 +416,24 @@ class MemoryBackend(BaseBackend):
             User identifier if authenticated
         metadata : dict[str, Any]
             Connection metadata (IP, user agent, etc.)
-        groups : set[str]
+        groups : frozenset[str]
             Initial groups the connection belongs to
         heartbeat_timeout : float
             Heartbeat timeout in seconds
 
         Notes
         -----
-        Thread-safe operation. Maintains bidirectional user-connection mappings.
+        Maintains bidirectional user-connection mappings.
 
         """
-        async with self._lock:
-            self._registry_connections.add(connection_id)
-            self._registry_connection_data[connection_id] = {
-                "user_id": user_id,
-                "metadata": metadata,
-                "groups": groups.copy(),
-                "heartbeat_timeout": heartbeat_timeout,
-            }
-            if user_id:
-                self._registry_user_connections[user_id].add(connection_id)
+        self._registry_insert(connection_id, user_id, metadata, groups, heartbeat_timeout)
 
     async def registry_add_connection_if_under_limit(
         self,
         connection_id: str,
         user_id: str | None,
         metadata: dict[str, Any],
-        groups: set[str],
+        groups: frozenset[str],
         heartbeat_timeout: float,
         max_connections: int,
     ) -> bool:
@@ -356,7 +447,7 @@ class MemoryBackend(BaseBackend):
             User identifier if authenticated, None for anonymous
         metadata : dict[str, Any]
             Additional connection metadata (IP, user agent, etc.)
-        groups : set[str]
+        groups : frozenset[str]
             Initial groups the connection belongs to
         heartbeat_timeout : float
             Heartbeat timeout in seconds
@@ -370,25 +461,15 @@ class MemoryBackend(BaseBackend):
 
         Notes
         -----
-        Atomic operation using asyncio lock prevents race conditions.
-        Since MemoryBackend is single-server only, this provides thread-safety
-        within a single process.
+        The check and the insert run without an intervening await, so the
+        operation is atomic on the event loop without needing a lock.
+        Since MemoryBackend is single-server only, this is sufficient.
 
         """
-        async with self._lock:
-            if len(self._registry_connections) >= max_connections:
-                return False
-
-            self._registry_connections.add(connection_id)
-            self._registry_connection_data[connection_id] = {
-                "user_id": user_id,
-                "metadata": metadata,
-                "groups": groups.copy(),
-                "heartbeat_timeout": heartbeat_timeout,
-            }
-            if user_id:
-                self._registry_user_connections[user_id].add(connection_id)
+        if len(self._registry_connections) >= max_connections:
+            return False
 
+        self._registry_insert(connection_id, user_id, metadata, groups, heartbeat_timeout)
         return True
 
     async def registry_remove_connection(self, connection_id: str, user_id: str | None) -> None:
@@ -403,37 +484,36 @@ class MemoryBackend(BaseBackend):
 
         Notes
         -----
-        Thread-safe operation. Cleans up user-connection mappings.
+        Cleans up user-connection mappings.
 
         """
-        async with self._lock:
-            self._registry_connections.discard(connection_id)
-            self._registry_connection_data.pop(connection_id, None)
-            if user_id and user_id in self._registry_user_connections:
-                self._registry_user_connections[user_id].discard(connection_id)
-                if not self._registry_user_connections[user_id]:
-                    del self._registry_user_connections[user_id]
-
-    async def registry_update_groups(self, connection_id: str, groups: set[str]) -> None:
+        self._registry_connections.discard(connection_id)
+        self._registry_connection_data.pop(connection_id, None)
+        if user_id and user_id in self._registry_user_connections:
+            self._registry_user_connections[user_id].discard(connection_id)
+            if not self._registry_user_connections[user_id]:
+                del self._registry_user_connections[user_id]
+
+    async def registry_update_groups(self, connection_id: str, groups: frozenset[str]) -> None:
         """Update groups for a connection in registry.
 
         Parameters
         ----------
         connection_id : str
             Connection identifier to update
-        groups : set[str]
+        groups : frozenset[str]
             New set of groups for the connection
 
         Notes
         -----
-        Thread-safe operation for dynamic group membership changes.
+        Used for dynamic group membership changes. Groups are frozen once on
+        write so reads can hand out the stored set without copying.
 
         """
-        async with self._lock:
-            if connection_id in self._registry_connection_data:
-                self._registry_connection_data[connection_id]["groups"] = groups.copy()
+        if connection_id in self._registry_connection_data:
+            self._registry_connection_data[connection_id]["groups"] = frozenset(groups)
 
-    async def registry_get_connection_groups(self, connection_id: str) -> set[str]:
+    async def registry_get_connection_groups(self, connection_id: str) -> frozenset[str]:
         """Get groups for a connection from registry.
 
         Parameters
@@ -443,14 +523,13 @@ class MemoryBackend(BaseBackend):
 
         Returns
         -------
-        set[str]
+        frozenset[str]
             Set of group names the connection belongs to
 
         """
-        async with self._lock:
-            if connection_id in self._registry_connection_data:
-                return self._registry_connection_data[connection_id]["groups"].copy()
-            return set()
+        if connection_id in self._registry_connection_data:
+            return self._registry_connection_data[connection_id]["groups"]
+        return frozenset()
 
     async def registry_count_connections(self) -> int:
         """Count total connections in registry.
@@ -461,10 +540,9 @@ class MemoryBackend(BaseBackend):
             Number of active connections
 
         """
-        async with self._lock:
-            return len(self._registry_connections)
+        return len(self._registry_connections)
 
-    async def registry_get_user_connections(self, user_id: str) -> set[str]:
+    async def registry_get_user_connections(self, user_id: str) -> frozenset[str]:
         """Get all connection IDs for a user.
 
         Parameters
@@ -474,12 +552,11 @@ class MemoryBackend(BaseBackend):
 
         Returns
         -------
-        set[str]
-            Set of connection IDs for the user
+        frozenset[str]
+            Connection IDs for the user
 
         """
-        async with self._lock:
-            return self._registry_user_connections.get(user_id, set()).copy()
+        return frozenset(self._registry_user_connections.get(user_id, ()))
 
     def registry_get_prefix(self) -> str:
         """Get registry key prefix for this backend.
@@ -507,3 +584,14 @@ class MemoryBackend(BaseBackend):
 
         """
         return False
+
+    def supports_raw_broadcast(self) -> bool:
+        """Memory backend queues pre-encoded frames directly.
+
+        Returns
+        -------
+        bool
+            Always True
+
+        """
+        return True
@@ -10,8 +10,9 @@ from redis.asyncio.connection import ConnectionPool
 from redis.exceptions import ConnectionError as RedisConnectionError
 from redis.exceptions import TimeoutError as RedisTimeoutError
 
-from fastapi_channels.serializers import JSONSerializer
+from fastapi_channels.serializers import JSONSerializer, ORJSONSerializer
 from fastapi_channels.utils import with_retry
+from fastapi_channels.utils.encoding import loads
 
 from .base import BaseBackend, CleanupStats, OrphanedGroupMembersStats
 
@@ -207,9 +208,11 @@ class RedisBackend(BaseBackend):
         Uses retry logic with exponential backoff for reliability.
 
         """
+        await self._publish_serialized(channel, self.serializer.dumps(message))
+
+    async def _publish_serialized(self, channel: str, serialized: str | bytes) -> None:
         redis_client: Redis = await self.redis
         full_channel = f"{self.channel_prefix}{channel}"
-        serialized = self.serializer.dumps(message)
 
         @self._get_retry_decorator()
         async def _publish() -> None:
@@ -286,9 +289,65 @@ class RedisBackend(BaseBackend):
         If exclude_channel is provided, that channel will not receive the message.
 
         """
-        redis_client: Redis = await self.redis
+        await self._group_publish(
+            group, self.serializer.dumps(message), exclude_channel=exclude_channel
+        )
+
+    async def group_send_raw(
+        self, group: str, payload: bytes, exclude_channel: str | None = None
+    ) -> None:
+        """Send a pre-encoded JSON message to all channels in Redis group.
+
+        Parameters
+        ----------
+        group : str
+            Target group name
+        payload : bytes
+            UTF-8 JSON encoding of the message payload
+        exclude_channel : str | None, optional
+            Channel to exclude from delivery. Default: None
+
+        Notes
+        -----
+        With a JSON serializer the payload is published as-is. Other serializers
+        cannot read JSON bytes, so the payload is decoded once and re-serialized.
+
+        """
+        if not self.supports_raw_broadcast():
+            await self.group_send(group, loads(payload), exclude_channel=exclude_channel)
+            return
+        await self._group_publish(group, payload, exclude_channel=exclude_channel)
+
+    async def group_send_many(
+        self, group: str, messages: list[dict[str, Any]], exclude_channel: str | None = None
+    ) -> None:
+        """Send several messages to all channels in Redis group.
+
+        Parameters
+        ----------
+        group : str
+            Target group name
+        messages : list[dict[str, Any]]
+            Message payloads to deliver, in order
+        exclude_channel : str | None, optional
+            Channel to exclude from delivery. Default: None
+
+        Notes
+        -----
+        Group members are streamed once and every message for a batch of members
+        is queued on a single pipeline, so N messages cost one round-trip per
+        member batch instead of N. Each channel receives the messages in order.
+
+        """
+        if not messages:
+            return
+        payloads = [self.serializer.dumps(message) for message in messages]
+        await self._group_publish(group, *payloads, exclude_channel=exclude_channel)
 
-        serialized = self.serializer.dumps(message)
+    async def _group_publish(
+        self, group: str, *payloads: str | bytes, exclude_channel: str | None
+    ) -> None:
+        redis_client: Redis = await self.redis
 
         # Stream group members in batches and use pipeline for each batch
         async for batch in self.group_channels_stream(group, batch_size=100):
@@ -302,16 +361,18 @@ class RedisBackend(BaseBackend):
             pipe = redis_client.pipeline()
             for channel in filtered_batch:
                 full_channel = f"{self.channel_prefix}{channel}"
-                pipe.publish(full_channel, serialized)
+                for serialized in payloads:
+                    pipe.publish(full_channel, serialized)
             try:
                 await pipe.execute()
             except Exception:
                 # Fallback to individual publishes if pipeline fails
                 for channel in filtered_batch:
-                    try:
-                        await self.publish(channel, message)
-                    except Exception:
-                        pass
+                    for serialized in payloads:
+                        try:
+                            await self._publish_serialized(channel, serialized)
+                        except Exception:
+                            pass
 
     async def group_add(self, group: str, channel: str) -> None:
         """Add channel to Redis group with optional TTL.
@@ -540,7 +601,7 @@ class RedisBackend(BaseBackend):
         connection_id: str,
         user_id: str | None,
         metadata: dict[str, Any],
-        groups: set[str],
+        groups: frozenset[str],
         heartbeat_timeout: float,
     ) -> None:
         """Add connection to Redis-based distributed registry.
@@ -553,7 +614,7 @@ class RedisBackend(BaseBackend):
             User identifier if authenticated
         metadata : dict[str, Any]
             Connection metadata (IP, user agent, etc.)
-        groups : set[str]
+        groups : frozenset[str]
             Initial groups the connection belongs to
         heartbeat_timeout : float
             Heartbeat timeout in seconds
@@ -592,7 +653,7 @@ class RedisBackend(BaseBackend):
         connection_id: str,
         user_id: str | None,
         metadata: dict[str, Any],
-        groups: set[str],
+        groups: frozenset[str],
         heartbeat_timeout: float,
         max_connections: int,
     ) -> bool:
@@ -608,7 +669,7 @@ class RedisBackend(BaseBackend):
             User identifier if authenticated, None for anonymous
         metadata : dict[str, Any]
             Additional connection metadata (IP, user agent, etc.)
-        groups : set[str]
+        groups : frozenset[str]
             Initial groups the connection belongs to
         heartbeat_timeout : float
             Heartbeat timeout in seconds
@@ -717,14 +778,14 @@ class RedisBackend(BaseBackend):
         if user_id:
             await redis_client.srem(self._registry_key("user", user_id), connection_id)
 
-    async def registry_update_groups(self, connection_id: str, groups: set[str]) -> None:
+    async def registry_update_groups(self, connection_id: str, groups: frozenset[str]) -> None:
         """Update groups for connection in Redis registry.
 
         Parameters
         ----------
         connection_id : str
             Connection identifier to update
-        groups : Set[str]
+        groups : frozenset[str]
             New set of groups for the connection
 
         Notes
@@ -778,7 +839,7 @@ class RedisBackend(BaseBackend):
 
         await pipe.execute()
 
-    async def registry_get_connection_groups(self, connection_id: str) -> set[str]:
+    async def registry_get_connection_groups(self, connection_id: str) -> frozenset[str]:
         """Get groups for a connection from Redis registry.
 
         Parameters
@@ -788,7 +849,7 @@ class RedisBackend(BaseBackend):
 
         Returns
         -------
-        set[str]
+        frozenset[str]
             Set of group names the connection belongs to
 
         Notes
@@ -803,10 +864,10 @@ class RedisBackend(BaseBackend):
         )
         if groups_data:
             try:
-                return set(json.loads(groups_data))
+                return frozenset(json.loads(groups_data))
             except (json.JSONDecodeError, TypeError):
                 pass
-        return set()
+        return frozenset()
 
     async def registry_count_connections(self) -> int:
         """Count total connections across all servers from Redis registry.
@@ -825,7 +886,7 @@ class RedisBackend(BaseBackend):
         redis_client: Any = await self.redis
         return int(await redis_client.scard(self._registry_key("connections")))
 
-    async def registry_get_user_connections(self, user_id: str) -> set[str]:
+    async def registry_get_user_connections(self, user_id: str) -> frozenset[str]:
         """Get all connection IDs for a user from Redis registry.
 
         Parameters
@@ -835,8 +896,8 @@ class RedisBackend(BaseBackend):
 
         Returns
         -------
-        set[str]
-            Set of connection IDs for the user
+        frozenset[str]
+            Connection IDs for the user
 
         Notes
         -----
@@ -849,7 +910,9 @@ class RedisBackend(BaseBackend):
         """
         redis_client: Any = await self.redis
         members = await redis_client.smembers(self._registry_key("user", user_id))
-        return {m.decode() if isinstance(m, (bytes, bytearray)) else str(m) for m in members}
+        return frozenset(
+            m.decode() if isinstance(m, (bytes, bytearray)) else str(m) for m in members
+        )
 
     async def registry_get_user_connections_stream(
         self, user_id: str, batch_size: int = 100
@@ -1121,3 +1184,15 @@ class RedisBackend(BaseBackend):
 
         """
         return True
+
+    def supports_raw_broadcast(self) -> bool:
+        """Check if pre-encoded JSON can be published without re-serializing.
+
+        Returns
+        -------
+        bool
+            True when the configured serializer reads JSON (JSONSerializer or
+            ORJSONSerializer), False for binary serializers such as pickle
+
+        """
+        return isinstance(self.serializer, (JSONSerializer, ORJSONSerializer))
@@ -49,6 +49,11 @@ class WSConfig(BaseSettings):
     WS_ENABLE_HEARTBEAT: bool
         Whether to enable heartbeat. Default: True
 
+    WS_MAX_QUEUE_DEPTH : int
+        Maximum number of undelivered messages buffered per connection by the
+        memory backend. Messages for a slow connection whose mailbox is full are
+        dropped and logged. 0 means unbounded. Default: 10000
+
     MAX_CONNECTIONS_PER_CLIENT : int
         Maximum concurrent connections per user. Default: 1000
 
@@ -98,6 +103,7 @@ class WSConfig(BaseSettings):
     WS_RECONNECT_MAX_ATTEMPTS: int = 5
     WS_RECONNECT_DELAY: int = 5  # seconds
     WS_ENABLE_HEARTBEAT: bool = True
+    WS_MAX_QUEUE_DEPTH: int = 10000
 
     MAX_CONNECTIONS_PER_CLIENT: int = 1000
     MAX_TOTAL_CONNECTIONS: int = 200000
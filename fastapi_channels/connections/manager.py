@@ -1,7 +1,6 @@
 import asyncio
 import base64
 import contextlib
-import json
 import logging
 import time
 from typing import TYPE_CHECKING, Any
@@ -16,6 +15,7 @@ from fastapi_channels.connections.state import Connection
 from fastapi_channels.exceptions import ConnectionError, create_error_context
 from fastapi_channels.typed import ConnectionState
 from fastapi_channels.utils import run_with_concurrency_limit, singleton
+from fastapi_channels.utils.encoding import TextFrame, dumps_bytes
 
 if TYPE_CHECKING:
     from fastapi_channels.backends import BaseBackend
@@ -93,7 +93,7 @@ class ConnectionManager:
                 group_expiry=self._config.REDIS_GROUP_EXPIRY,
             )
         else:
-            self._backend = MemoryBackend()
+            self._backend = MemoryBackend(max_queue_depth=self._config.WS_MAX_QUEUE_DEPTH)
 
         self._registry = ConnectionRegistry(
             backend=self._backend,
@@ -139,6 +139,7 @@ class ConnectionManager:
         user_id: str | None = None,
         connection_id: str | None = None,
         metadata: dict[str, Any] | None = None,
+        subprotocol: str | None = None,
     ) -> Connection:
         """Establish new WebSocket connection.
 
@@ -152,6 +153,10 @@ class ConnectionManager:
             Custom connection identifier. Default: None (auto-generated)
         metadata : dict[str, Any] | None, optional
             Additional connection metadata. Default: None
+        subprotocol : str | None, optional
+            WebSocket subprotocol to accept, chosen from the client's offered
+            ``websocket.scope["subprotocols"]`` (e.g. "msgpack" when the consumer
+            uses MsgpackSerializer as its codec). Default: None
 
         Returns
         -------
@@ -184,7 +189,7 @@ class ConnectionManager:
                     context=context,
                 )
 
-        await websocket.accept()
+        await websocket.accept(subprotocol=subprotocol)
 
         channel_name = await self.backend.new_channel(prefix=f"ws.{user_id}" if user_id else "ws")
 
@@ -200,7 +205,9 @@ class ConnectionManager:
             heartbeat_timeout=self.registry.heartbeat_timeout,
         )
 
-        await self.registry.backend.subscribe(connection.channel_name)
+        subscription = await self.registry.backend.subscribe(connection.channel_name)
+        if isinstance(subscription, asyncio.Queue):
+            connection.mailbox = subscription
 
         receiver_task = asyncio.create_task(self._receive_loop(connection.channel_name))
         self._receiver_tasks[connection.channel_name] = receiver_task
@@ -214,8 +221,8 @@ class ConnectionManager:
             return False
 
         try:
-            await connection.websocket.send_json(message)
-            payload_bytes = json.dumps(message).encode()
+            payload_bytes = dumps_bytes(message)
+            await connection.websocket.send_text(payload_bytes.decode())
             connection.message_count += 1
             connection.bytes_sent += len(payload_bytes)
             connection.update_activity()
@@ -249,7 +256,10 @@ class ConnectionManager:
         try:
             await connection.websocket.send_text(text)
             connection.message_count += 1
-            connection.bytes_sent += len(text.encode())
+            # Group fan-out frames carry their byte length; other text is measured here
+            connection.bytes_sent += (
+                text.nbytes if isinstance(text, TextFrame) else len(text.encode())
+            )
             connection.update_activity()
             return True
         except RuntimeError:
@@ -289,16 +299,19 @@ class ConnectionManager:
         except Exception:
             return False
 
-    async def _safe_send_message(self, connection: Connection, message: dict[str, Any]) -> bool:
+    async def _safe_send_message(
+        self, connection: Connection, message: dict[str, Any] | str | bytes
+    ) -> bool:
         """Safely send message to connection, routing based on content type.
 
         Parameters
         ----------
         connection : Connection
             Target connection
-        message : dict[str, Any]
-            Message payload. If contains 'binary_data' (base64-encoded), sends as bytes.
-            Otherwise sends as JSON.
+        message : dict[str, Any] | str | bytes
+            Message payload. Pre-encoded frames (str from a group fan-out, or bytes)
+            are sent as-is. A dict containing 'binary_data' (base64-encoded) is sent
+            as bytes, any other dict as JSON.
 
         Returns
         -------
@@ -306,6 +319,10 @@ class ConnectionManager:
             True if sent successfully, False otherwise
 
         """
+        if isinstance(message, str):
+            return await self._safe_send_text(connection, message)
+        if isinstance(message, bytes):
+            return await self._safe_send_bytes(connection, message)
         if "binary_data" in message:
             binary_data = await asyncio.to_thread(base64.b64decode, message["binary_data"])
             return await self._safe_send_bytes(connection, binary_data)
@@ -380,7 +397,7 @@ class ConnectionManager:
         """
         await self.backend.publish(connection_id, message)
         if conn := self.registry.get(connection_id):
-            payload_bytes = json.dumps(message).encode()
+            payload_bytes = dumps_bytes(message)
             conn.message_count += 1
             conn.bytes_sent += len(payload_bytes)
 
@@ -401,6 +418,46 @@ class ConnectionManager:
         """
         await self.backend.group_send(group, message)
 
+    async def send_group_many(self, group: str, messages: list[dict[str, Any]]) -> None:
+        """Send several messages, in order, to all connections in a group.
+
+        Parameters
+        ----------
+        group : str
+            Target group name
+        messages : list[dict[str, Any]]
+            Message payloads to send
+
+        Notes
+        -----
+        Uses backend group_send_many so networked backends can batch the
+        deliveries into one round-trip per member batch.
+
+        """
+        await self.backend.group_send_many(group, messages)
+
+    async def send_group_raw(
+        self, group: str, payload: bytes, exclude_connection_id: str | None = None
+    ) -> None:
+        """Send a pre-encoded JSON message to all connections in a group.
+
+        Parameters
+        ----------
+        group : str
+            Target group name
+        payload : bytes
+            UTF-8 JSON encoding of the message payload
+        exclude_connection_id : str | None, optional
+            Connection ID to exclude from message delivery. Default: None
+
+        Notes
+        -----
+        Backends reporting supports_raw_broadcast() fan the bytes out without
+        re-serializing; others decode the payload once and use group_send.
+
+        """
+        await self.backend.group_send_raw(group, payload, exclude_channel=exclude_connection_id)
+
     async def send_group_except(
         self, group: str, message: dict[str, Any], exclude_connection_id: str
     ) -> None:
@@ -542,9 +599,13 @@ class ConnectionManager:
         if not connection:
             return
 
+        mailbox = connection.mailbox
         while connection.state == ConnectionState.CONNECTED:
             try:
-                message = await self.backend.receive(channel_name, timeout=1)
+                if mailbox is not None:
+                    message = await asyncio.wait_for(mailbox.get(), timeout=1)
+                else:
+                    message = await self.backend.receive(channel_name, timeout=1)
                 if not message:
                     continue
 
@@ -57,14 +57,14 @@ class ConnectionRegistry:
     ...     user_id="alice",
     ...     metadata={"ip": "192.168.1.1"}
     ... )
-    >>> print(connection.channel_name)  # ws.alice.1640995200000.a1b2c3d4
+    >>> print(connection.channel_name)  # ws.alice.a1b2c3d4.1
 
     Notes
     -----
     Connection limits are enforced atomically using backend.registry_add_connection_if_under_limit(),
     which prevents race conditions in distributed deployments. The Redis backend uses a Lua script
-    for true atomicity across all server instances, while the Memory backend uses asyncio locks
-    for thread-safety within a single process.
+    for true atomicity across all server instances, while the Memory backend performs the
+    check and insert without yielding to the event loop.
 
     """
 
@@ -141,7 +141,7 @@ class ConnectionRegistry:
             connection_id=conn_id,
             user_id=connection.user_id,
             metadata=connection.metadata,
-            groups=connection.groups,
+            groups=frozenset(connection.groups),
             heartbeat_timeout=connection.heartbeat_timeout,
             max_connections=self.max_connections,
         )
@@ -288,7 +288,7 @@ class ConnectionRegistry:
             connection.groups.add(group)
             # Persist groups to backend for cross-server visibility and cleanup.
             await self.backend.registry_update_groups(
-                connection_id=connection_id, groups=connection.groups
+                connection_id=connection_id, groups=frozenset(connection.groups)
             )
 
     async def remove_from_group(self, connection_id: str, group: str) -> None:
@@ -311,10 +311,10 @@ class ConnectionRegistry:
             connection.groups.discard(group)
             # Persist groups to backend for cross-server visibility and cleanup.
             await self.backend.registry_update_groups(
-                connection_id=connection_id, groups=connection.groups
+                connection_id=connection_id, groups=frozenset(connection.groups)
             )
 
-    async def user_channels(self, user_id: str) -> set[str]:
+    async def user_channels(self, user_id: str) -> frozenset[str]:
         """Get all connection channel names for a user across all servers.
 
         Parameters
@@ -324,8 +324,8 @@ class ConnectionRegistry:
 
         Returns
         -------
-        set[str]
-            Set of channel names for the user
+        frozenset[str]
+            Channel names for the user
 
         Notes
         -----
@@ -334,7 +334,7 @@ class ConnectionRegistry:
 
         """
         if not user_id:
-            return set()
+            return frozenset()
 
         return await self.backend.registry_get_user_connections(user_id)
 
@@ -1,3 +1,4 @@
+import asyncio
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any
@@ -57,6 +58,9 @@ class Connection:
         Heartbeat monitoring instance. Default: new HeartbeatMonitor
     state : ConnectionState, optional
         Current connection state. Default: CONNECTED
+    mailbox : asyncio.Queue | None, optional
+        Queue the backend delivers this connection's messages into, for backends
+        that hand out a subscription queue (MemoryBackend). Default: None
 
     Examples
     --------
@@ -64,7 +68,7 @@ class Connection:
 
     >>> connection = Connection(
     ...     websocket=ws,
-    ...     channel_name="ws.alice.1640995200000.a1b2c3d4",
+    ...     channel_name="ws.alice.a1b2c3d4.1",
     ...     user_id="alice",
     ...     metadata={"ip": "192.168.1.100", "device": "mobile"},
     ...     heartbeat_timeout=30.0
@@ -92,6 +96,7 @@ class Connection:
     heartbeat_timeout: float = 60.0
     heartbeat: HeartbeatMonitor = field(default_factory=HeartbeatMonitor)
     state: ConnectionState = ConnectionState.CONNECTED
+    mailbox: asyncio.Queue | None = None
 
     @property
     def now(self) -> datetime:
@@ -1,11 +1,35 @@
-import json
+import asyncio
+import logging
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Any
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from fastapi_channels.connections import Connection, ConnectionManager
 from fastapi_channels.exceptions import BaseError, ValidationError, create_error_context
 from fastapi_channels.middleware import Middleware
-from fastapi_channels.typed import Message, MessagePriority
+from fastapi_channels.serializers import (
+    BaseSerializer,
+    JSONSerializer,
+    MsgpackSerializer,
+    ORJSONSerializer,
+)
+from fastapi_channels.typed import (
+    _PRIORITY_BY_VALUE,
+    _PRIORITY_NORMAL,
+    _PRIORITY_NORMAL_VALUE,
+    Message,
+)
+from fastapi_channels.utils.encoding import dumps_bytes, loads
+
+logger = logging.getLogger(__name__)
+
+# Exact heartbeat replies as clients usually encode them; matched before any JSON parsing
+_PONG_FRAMES = frozenset(
+    {'{"type":"pong"}', '{"type": "pong"}', b'{"type":"pong"}', b'{"type": "pong"}'}
+)
+
+# Codecs that only decode plain data, so they are safe to run on untrusted client frames
+_SAFE_CODECS = (JSONSerializer, MsgpackSerializer, ORJSONSerializer)
 
 
 class BaseConsumer:
@@ -35,6 +59,15 @@ class BaseConsumer:
         Manager for connection lifecycle and messaging. Required.
     middleware_stack : Middleware | None, optional
         Message processing middleware chain. Default: None
+    codec : BaseSerializer | None, optional
+        Envelope codec replacing the built-in JSON encoding, e.g. MsgpackSerializer.
+        A binary codec sends binary frames, decodes inbound binary frames as message
+        envelopes and still parses text frames as JSON. A text codec (JSON, ORJSON)
+        sends and decodes text frames, and inbound binary frames stay binary
+        messages, as without a codec. Only JSONSerializer,
+        ORJSONSerializer and MsgpackSerializer (or subclasses) are accepted, since the
+        codec decodes frames sent by the client; PickleSerializer would execute
+        arbitrary code. Default: None (JSON)
 
     Examples
     --------
@@ -59,21 +92,100 @@ class BaseConsumer:
     Heartbeat messages ("pong") are handled automatically.
     The disconnect() method is provided by BaseConsumer and handles both
     consumer cleanup (via on_disconnect()) and connection manager disconnection.
+    BaseConsumer declares __slots__. Subclasses that do not declare their own
+    __slots__ still get a per-instance __dict__, so declare them to keep the
+    memory saving when running many concurrent consumers.
+    JSON is sent as text frames by default. Set the class attribute
+    ``json_as_bytes = True`` on a subclass to send the encoded JSON as binary
+    frames instead, skipping the str decode and the text-frame UTF-8 handling;
+    clients must then decode binary frames as JSON.
+    A codec only applies to frames this consumer sends and receives; group and
+    personal messages delivered by the ConnectionManager are still JSON. To pick
+    the codec per client, negotiate a WebSocket subprotocol (see
+    ConnectionManager.connect) and pass the matching serializer.
+    Set ``outbound_batch_size`` above 0 to queue send() calls on a per-connection
+    outbound queue drained by one sender task. Messages that pile up while a frame
+    is being written are coalesced, up to that many, into a single send_many()
+    frame (a JSON array), so clients must accept both single envelopes and arrays.
+    The other send methods wait for the queue to drain before writing, so frames
+    still leave in call order. Once disconnect() has run, or the sender task has
+    failed to write a frame, send() drops messages.
+    The middleware chain is flattened into a list of process() methods whenever
+    ``middleware_stack`` is assigned. A middleware that overrides ``__call__`` is
+    kept whole and runs the rest of the chain itself. Extending the chain in place
+    with ``|`` after construction is not seen until ``middleware_stack`` is
+    assigned again.
 
     """
 
+    __slots__ = (
+        "connection",
+        "manager",
+        "_middleware_stack",
+        "codec",
+        "_middleware_funcs",
+        "_out_queue",
+        "_sender_task",
+        "_closed",
+    )
+
+    json_as_bytes: ClassVar[bool] = False
+    # 0 sends directly from send(); N > 0 coalesces up to N queued messages per frame
+    outbound_batch_size: ClassVar[int] = 0
+    outbound_queue_size: ClassVar[int] = 1000
+
     def __init__(
         self,
         connection: Connection,
         manager: ConnectionManager,
         middleware_stack: Middleware | None = None,
+        codec: BaseSerializer | None = None,
     ):
         if manager is None:
             raise ValueError("'manager' must be provided")
+        if codec is not None and not isinstance(codec, _SAFE_CODECS):
+            raise ValueError(
+                f"Unsupported codec {type(codec).__name__}: expected JSONSerializer, "
+                "ORJSONSerializer or MsgpackSerializer"
+            )
 
         self.connection = connection
         self.manager = manager
         self.middleware_stack = middleware_stack
+        self.codec = codec
+        self._out_queue: asyncio.Queue[Message] | None = None
+        self._sender_task: asyncio.Task | None = None
+        self._closed = False
+
+    @property
+    def middleware_stack(self) -> Middleware | None:
+        """Head of the message processing middleware chain."""
+        return self._middleware_stack
+
+    @middleware_stack.setter
+    def middleware_stack(self, middleware_stack: Middleware | None) -> None:
+        self._middleware_stack = middleware_stack
+        self._middleware_funcs = self._flatten_middleware(middleware_stack)
+
+    @staticmethod
+    def _flatten_middleware(middleware_stack: Middleware | None) -> list:
+        """Unwind a middleware chain into a flat list of process methods.
+
+        Running the list in a loop avoids one coroutine frame per chain link.
+        Middlewares disabled via an ``enabled`` attribute are left out entirely.
+        A middleware with its own ``__call__`` ends the list as a whole callable,
+        since it decides how the rest of the chain runs.
+        """
+        funcs = []
+        middleware = middleware_stack
+        while middleware is not None:
+            if type(middleware).__call__ is not Middleware.__call__:
+                funcs.append(middleware)
+                break
+            if getattr(middleware, "enabled", True):
+                funcs.append(middleware.process)
+            middleware = middleware.next_middleware
+        return funcs
 
     @abstractmethod
     async def connect(self) -> None:
@@ -109,13 +221,21 @@ class BaseConsumer:
         -----
         This method:
         1. Calls `on_disconnect()` for consumer-specific cleanup
-        2. Disconnects from the connection manager (handles WebSocket closure, group cleanup, etc.)
+        2. Stops the outbound sender task, if any; queued messages not yet sent are dropped,
+           as are later send() calls
+        3. Disconnects from the connection manager (handles WebSocket closure, group cleanup, etc.)
 
         Subclasses should override `on_disconnect()` instead of `disconnect()` to add
         custom cleanup logic.
 
         """
         await self.on_disconnect(code)
+        self._closed = True
+        if self._sender_task is not None:
+            self._sender_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._sender_task
+            self._sender_task = None
         await self.manager.disconnect(self.connection.channel_name, code=code)
 
     @abstractmethod
@@ -178,21 +298,155 @@ class BaseConsumer:
         -----
         Routes to appropriate WebSocket send method based on message content:
         - If binary_data is set: uses send_bytes()
-        - If data is set: uses send_json()
+        - If a codec is set: sends the codec encoding of to_dict()
+        - Otherwise: sends the message's JSON encoding as text (or as
+          bytes when json_as_bytes is set)
+        When outbound_batch_size is set, the message is queued for the sender task
+        instead and this returns once it is enqueued; after disconnect() it is dropped.
         Updates connection statistics (message count, bytes sent).
 
         """
+        if self.outbound_batch_size > 0:
+            if self._closed:
+                return
+            if self._sender_task is None or self._sender_task.done():
+                if self._out_queue is None:
+                    self._out_queue = asyncio.Queue(maxsize=self.outbound_queue_size)
+                self._sender_task = asyncio.create_task(self._drain_outbound(self._out_queue))
+            await self._out_queue.put(message)
+            return
+        await self._send_now(message)
+
+    async def _send_now(self, message: Message) -> None:
         if message.binary_data is not None:
             await self.connection.websocket.send_bytes(message.binary_data)
             self.connection.message_count += 1
             self.connection.bytes_sent += len(message.binary_data)
+        elif self.codec is not None:
+            self.connection.bytes_sent += await self._send_with_codec(message.to_dict())
+            self.connection.message_count += 1
         else:
-            await self.connection.websocket.send_json(message.to_dict())
-            payload_bytes = json.dumps(message.to_dict()).encode()
+            payload_bytes = message.dumps()
+            await self._send_encoded_json(payload_bytes)
             self.connection.message_count += 1
             self.connection.bytes_sent += len(payload_bytes)
         self.connection.update_activity()
 
+    async def _drain_outbound(self, queue: "asyncio.Queue[Message]") -> None:
+        try:
+            while True:
+                batch = [await queue.get()]
+                while len(batch) < self.outbound_batch_size:
+                    try:
+                        batch.append(queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                try:
+                    # Binary messages keep their own bytes frames; JSON runs between them merge
+                    pending: list[Message] = []
+                    for message in batch:
+                        if message.binary_data is None:
+                            pending.append(message)
+                            continue
+                        await self._send_coalesced(pending)
+                        pending = []
+                        await self._send_now(message)
+                    await self._send_coalesced(pending)
+                except Exception:
+                    # The socket is unusable; drop later sends instead of restarting
+                    self._closed = True
+                    logger.warning(
+                        "Outbound sender stopped for %s; further sends are dropped",
+                        self.connection.channel_name,
+                        exc_info=True,
+                        extra={
+                            "connection_id": self.connection.channel_name,
+                            "component": "consumer.outbound",
+                        },
+                    )
+                    return
+                finally:
+                    for _ in batch:
+                        queue.task_done()
+        finally:
+            # Anything left unsent is dropped so _flush_outbound() never waits on it
+            while not queue.empty():
+                queue.get_nowait()
+                queue.task_done()
+
+    async def _flush_outbound(self) -> None:
+        # Direct writes wait for queued messages so frames leave in call order
+        if self._sender_task is not None and not self._sender_task.done():
+            await self._out_queue.join()
+
+    async def _send_coalesced(self, messages: list[Message]) -> None:
+        if len(messages) == 1:
+            await self._send_now(messages[0])
+        elif messages:
+            await self._send_many_now(messages)
+
+    async def send_many(self, messages: list[Message], ndjson: bool = False) -> None:
+        """Send several Message objects to the client in a single frame.
+
+        Parameters
+        ----------
+        messages : list[Message]
+            Messages to send, in order
+        ndjson : bool, optional
+            If True, frame the batch as newline-delimited JSON (one message envelope
+            per line). If False, frame it as a JSON array of message envelopes.
+            Ignored when a codec is set. Default: False
+
+        Notes
+        -----
+        Each message is JSON-encoded once, and the batch is written as one
+        frame (text, or binary when json_as_bytes is set). With a codec, the batch
+        is the codec encoding of a list of envelopes. Binary payloads are
+        base64-encoded in the ``binary_data`` field, as in to_dict(). Clients must
+        unpack the batch themselves.
+        Updates connection statistics (one count per message, bytes sent).
+
+        """
+        if not messages:
+            return
+        await self._flush_outbound()
+        await self._send_many_now(messages, ndjson)
+
+    async def _send_many_now(self, messages: list[Message], ndjson: bool = False) -> None:
+        if self.codec is not None:
+            envelopes = [message.to_dict() for message in messages]
+            self.connection.bytes_sent += await self._send_with_codec(envelopes)
+            self.connection.message_count += len(messages)
+            self.connection.update_activity()
+            return
+        encoded = [message.dumps() for message in messages]
+        if ndjson:
+            payload_bytes = b"\n".join(encoded)
+        else:
+            payload_bytes = b"[" + b",".join(encoded) + b"]"
+        await self._send_encoded_json(payload_bytes)
+        self.connection.message_count += len(messages)
+        self.connection.bytes_sent += len(payload_bytes)
+        self.connection.update_activity()
+
+    async def _send_encoded_json(self, payload_bytes: bytes) -> None:
+        if self.json_as_bytes:
+            await self.connection.websocket.send_bytes(payload_bytes)
+        else:
+            await self.connection.websocket.send_text(payload_bytes.decode())
+
+    async def _send_with_codec(self, data: Any) -> int:
+        # Frame type follows codec.binary, matching how handle_message picks the decoder
+        payload = self.codec.dumps(data)
+        if self.codec.binary:
+            await self.connection.websocket.send_bytes(payload)
+            return len(payload)
+        if isinstance(payload, bytes):
+            await self.connection.websocket.send_text(payload.decode())
+            return len(payload)
+        await self.connection.websocket.send_text(payload)
+        return len(payload.encode())
+
     async def send_text(self, data: str) -> None:
         """Send plain text message to the connected client.
 
@@ -207,6 +461,7 @@ class BaseConsumer:
         Updates connection statistics (message count, bytes sent).
 
         """
+        await self._flush_outbound()
         await self.connection.websocket.send_text(data)
         self.connection.message_count += 1
         self.connection.bytes_sent += len(data.encode())
@@ -222,12 +477,19 @@ class BaseConsumer:
 
         Notes
         -----
-        Sends directly as JSON, no Message wrapper, no string conversion.
+        Encodes once and sends as a JSON text frame (binary frame when
+        json_as_bytes is set), no Message wrapper. Uses the codec instead when set.
         Updates connection statistics (message count, bytes sent).
 
         """
-        await self.connection.websocket.send_json(data)
-        payload_bytes = json.dumps(data).encode()
+        await self._flush_outbound()
+        if self.codec is not None:
+            self.connection.bytes_sent += await self._send_with_codec(data)
+            self.connection.message_count += 1
+            self.connection.update_activity()
+            return
+        payload_bytes = dumps_bytes(data)
+        await self._send_encoded_json(payload_bytes)
         self.connection.message_count += 1
         self.connection.bytes_sent += len(payload_bytes)
         self.connection.update_activity()
@@ -246,6 +508,7 @@ class BaseConsumer:
         Updates connection statistics (message count, bytes sent).
 
         """
+        await self._flush_outbound()
         await self.connection.websocket.send_bytes(data)
         self.connection.message_count += 1
         self.connection.bytes_sent += len(data)
@@ -295,17 +558,49 @@ class BaseConsumer:
 
         Notes
         -----
-        Automatically serializes Message objects.
-        Sends to all connections in group except sender.
+        Automatically serializes Message objects. When the backend supports raw
+        broadcast, a JSON Message is encoded once here and the bytes
+        are fanned out as-is. Messages carrying binary_data take the dict path.
 
         """
+        if (
+            isinstance(message, Message)
+            and message.binary_data is None
+            and self.manager.backend.supports_raw_broadcast()
+        ):
+            await self.manager.send_group_raw(group, message.dumps())
+            return
         payload = message.to_dict() if isinstance(message, Message) else message
         await self.manager.send_group(group, payload)
 
+    async def send_many_to_group(
+        self, group: str, messages: list[dict[str, Any] | Message]
+    ) -> None:
+        """Send several messages, in order, to all connections in a group.
+
+        Parameters
+        ----------
+        group : str
+            Target group name
+        messages : list[dict[str, Any] | Message]
+            Messages to send to group
+
+        Notes
+        -----
+        Automatically serializes Message objects. Hands the whole batch to the
+        backend at once so it can pipeline the deliveries.
+
+        """
+        payloads = [
+            message.to_dict() if isinstance(message, Message) else message for message in messages
+        ]
+        await self.manager.send_group_many(group, payloads)
+
     async def handle_message(
         self,
-        json_str: str | None = None,
+        json_str: str | bytes | None = None,
         binary: bytes | None = None,
+        raw_size: int | None = None,
     ) -> None:
         """Process incoming WebSocket message.
 
@@ -313,10 +608,15 @@ class BaseConsumer:
 
         Parameters
         ----------
-        json_str : str | None, optional
-            JSON message as string (will be parsed). Default: None
+        json_str : str | bytes | None, optional
+            JSON message as string or UTF-8 bytes (will be parsed). Bytes are
+            decoded directly without an intermediate str. Default: None
         binary : bytes | None, optional
-            Binary message. Default: None
+            Binary message, or an encoded envelope when a binary codec is set.
+            Default: None
+        raw_size : int | None, optional
+            Size in bytes of the original frame, if the caller already knows it.
+            Saves re-encoding a str json_str just to count it. Default: None
 
         Raises
         ------
@@ -329,12 +629,17 @@ class BaseConsumer:
 
         Notes
         -----
-        Exactly one parameter must be provided.
+        Exactly one of json_str or binary must be provided.
         JSON strings are always parsed - message type is determined from parsed JSON.
-        Handles heartbeat ("pong") messages automatically.
+        Handles heartbeat ("pong") messages automatically; the bare ``{"type":"pong"}``
+        frame is recognised without parsing, other pong shapes after parsing.
         Tracks message statistics (bytes received, activity).
 
         """
+        if binary is None and json_str in _PONG_FRAMES:
+            self.connection.update_heartbeat()
+            return
+
         provided = sum(1 for param in [json_str, binary] if param is not None)
         if provided != 1:
             context = create_error_context(
@@ -348,6 +653,14 @@ class BaseConsumer:
                 context=context,
             )
 
+        decode = loads
+        if self.codec is not None:
+            if not self.codec.binary:
+                decode = self.codec.loads
+            elif binary is not None:
+                # Binary frames carry codec-encoded envelopes; parse them like JSON
+                json_str, binary, decode = binary, None, self.codec.loads
+
         if binary is not None:
             message = Message(
                 type="binary",
@@ -355,11 +668,12 @@ class BaseConsumer:
                 binary_data=binary,
                 sender_id=self.connection.channel_name,
             )
-            self.connection.bytes_received += len(binary)
+            message.raw_size = len(binary)
+            self.connection.bytes_received += message.raw_size
             self.connection.update_activity()
 
-            if self.middleware_stack:
-                message = await self.middleware_stack(message, self.connection, self)
+            for process in self._middleware_funcs:
+                message = await process(message, self.connection, self)
                 if not message:
                     return
 
@@ -374,8 +688,9 @@ class BaseConsumer:
             )
 
             try:
-                json_data = json.loads(json_str)
-            except json.JSONDecodeError as e:
+                json_data = decode(json_str)
+            except ValueError as e:
+                # JSONDecodeError and msgpack unpack errors are ValueError subclasses
                 raise ValidationError(
                     message="Invalid JSON format",
                     error_code="INVALID_JSON",
@@ -404,27 +719,35 @@ class BaseConsumer:
                 self.connection.update_heartbeat()
                 return
 
-            priority_value = json_data.get("priority", MessagePriority.NORMAL.value)
-            priority = (
-                MessagePriority(priority_value)
-                if priority_value in MessagePriority._value2member_map_
-                else MessagePriority.NORMAL
-            )
+            if len(json_data) == 2 and "data" in json_data:
+                # Common {"type", "data"} shape: every other field keeps its default
+                message = Message(message_type, json_data["data"], self.connection.channel_name)
+            else:
+                get = json_data.get
+                priority = _PRIORITY_BY_VALUE.get(
+                    get("priority", _PRIORITY_NORMAL_VALUE), _PRIORITY_NORMAL
+                )
 
-            message = Message(
-                type=message_type,
-                data=json_data.get("data"),
-                sender_id=self.connection.channel_name,
-                metadata=json_data.get("metadata"),
-                ttl_seconds=json_data.get("ttl_seconds"),
-                priority=priority,
-            )
+                # Positional in field order: type, data, sender_id, group, metadata,
+                # priority, ttl_seconds (avoids keyword dispatch per message)
+                message = Message(
+                    message_type,
+                    get("data"),
+                    self.connection.channel_name,
+                    None,
+                    get("metadata"),
+                    priority,
+                    get("ttl_seconds"),
+                )
+            if raw_size is None:
+                raw_size = len(json_str) if isinstance(json_str, bytes) else len(json_str.encode())
+            message.raw_size = raw_size
 
-            self.connection.bytes_received += len(json_str.encode())
+            self.connection.bytes_received += message.raw_size
             self.connection.update_activity()
 
-            if self.middleware_stack:
-                message = await self.middleware_stack(message, self.connection, self)
+            for process in self._middleware_funcs:
+                message = await process(message, self.connection, self)
                 if not message:
                     return
 
@@ -102,6 +102,10 @@ class BaseError(Exception, ABC):
             self._log_error()
 
     def _log_error(self) -> None:
+        level = logging.CRITICAL if self.severity == ErrorSeverity.CRITICAL else logging.ERROR
+        if not self._logger.isEnabledFor(level):
+            return
+
         log_data = {
             "error_code": self.error_code,
             "category": self.category.value,
@@ -115,7 +119,7 @@ class BaseError(Exception, ABC):
         if self.cause:
             log_data["cause"] = str(self.cause)
 
-        if self.severity == ErrorSeverity.CRITICAL:
+        if level == logging.CRITICAL:
             self._logger.critical("Critical error occurred", extra=log_data)
         else:
             self._logger.error("High severity error occurred", extra=log_data)
@@ -20,7 +20,14 @@ class Middleware(ABC):
         connection: Connection,
         consumer: BaseConsumer,
     ) -> Message | None:
-        """Process message then pass to next middleware."""
+        """Process message then pass to next middleware.
+
+        BaseConsumer does not call this for each link: it flattens the chain into
+        a list of process() methods when its middleware_stack is assigned. An
+        override of __call__ is honoured, and that middleware then runs the rest of
+        the chain. Links added with | after the consumer is built take effect once
+        middleware_stack is assigned again.
+        """
         processed_message = await self.process(message, connection, consumer)
         if processed_message is not None and self.next_middleware:
             return await self.next_middleware(processed_message, connection, consumer)
@@ -12,10 +12,11 @@ class LoggingMiddleware(Middleware):
             self._logger.setLevel(logging.INFO)
 
     async def process(self, message, connection, consumer):
-        self._logger.info(
-            "ws message type=%s channel=%s user=%s",
-            message.type,
-            connection.channel_name,
-            connection.user_id,
-        )
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                "ws message type=%s channel=%s user=%s",
+                message.type,
+                connection.channel_name,
+                connection.user_id,
+            )
         return message
@@ -1,7 +1,9 @@
 import logging
 import time
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
+from fastapi_channels.config import WSConfig
 from fastapi_channels.exceptions import RateLimitError
 from fastapi_channels.middleware import Middleware
 
@@ -11,36 +13,64 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _default_max_keys() -> int:
+    # Room for every connection the configured server accepts, plus churn
+    return WSConfig().MAX_TOTAL_CONNECTIONS * 2
+
+
 class TokenBucketRateLimiter:
     """Simple in-memory token bucket rate limiter per key.
 
+    Bucket state is kept in two parallel dicts (last refill time and token
+    count) that are updated in place, so allow() allocates nothing per call.
+    Tokens are fractional, so partial refills between calls are not lost.
+    At most max_keys buckets are tracked; the least recently used bucket is
+    evicted when a new key would exceed the limit. max_keys defaults to twice
+    MAX_TOTAL_CONNECTIONS from the settings loaded when the limiter is built.
+
     Note: This limiter is NOT distributed and only works within a single
     server instance. For distributed deployments, use RedisRateLimiter.
     """
 
-    def __init__(self, rate: int, window_seconds: int, burst_size: int):
+    def __init__(
+        self,
+        rate: int,
+        window_seconds: int,
+        burst_size: int,
+        max_keys: int | None = None,
+    ):
         self.rate = rate
         self.window = window_seconds
         self.burst = burst_size
-        self.buckets: dict[str, tuple[float, int]] = {}
+        self.max_keys = max_keys if max_keys is not None else _default_max_keys()
+        if self.max_keys < 1:
+            raise ValueError(f"max_keys must be at least 1, got {self.max_keys}")
+        self._refill_per_second = rate / window_seconds
+        # Ordered by recency of use; drives LRU eviction for both dicts
+        self._last: OrderedDict[str, float] = OrderedDict()
+        self._tokens: dict[str, float] = {}
 
     def allow(self, key: str) -> bool:
-        now = time.time()
-
-        if key not in self.buckets:
-            self.buckets[key] = (now, self.burst - 1)
+        now = time.monotonic()
+
+        tokens = self._tokens.get(key)
+        if tokens is None:
+            if len(self._last) >= self.max_keys:
+                evicted, _ = self._last.popitem(last=False)
+                del self._tokens[evicted]
+            self._last[key] = now
+            self._tokens[key] = self.burst - 1
             return True
 
-        last_check, tokens = self.buckets[key]
-        elapsed = now - last_check
+        tokens = min(self.burst, tokens + (now - self._last[key]) * self._refill_per_second)
+        self._last[key] = now
+        self._last.move_to_end(key)
 
-        tokens = min(self.burst, tokens + int(elapsed * (self.rate / self.window)))
-
-        if tokens > 0:
-            self.buckets[key] = (now, tokens - 1)
+        if tokens >= 1:
+            self._tokens[key] = tokens - 1
             return True
 
-        self.buckets[key] = (now, 0)
+        self._tokens[key] = tokens
         return False
 
 
@@ -194,6 +224,17 @@ class RateLimitMiddleware(Middleware):
         Redis client for distributed rate limiting. Default: None (in-memory)
     key_prefix : str, optional
         Redis key prefix. Default: "ratelimit:"
+    excluded_message_types : set[str] | None, optional
+        Message types that bypass rate limiting, stored as a frozenset.
+        Default: None (no exclusions)
+    max_tracked_keys : int | None, optional
+        Maximum number of buckets kept by the in-memory limiter before the least
+        recently used one is evicted. Must be at least 1. Default: None
+        (2 * MAX_TOTAL_CONNECTIONS from the WSConfig settings loaded when the
+        middleware is built)
+    enabled : bool, optional
+        When False, the middleware passes every message through without any
+        rate limit bookkeeping. Default: True
 
     Examples
     --------
@@ -218,14 +259,20 @@ class RateLimitMiddleware(Middleware):
         redis: "Redis | None" = None,
         key_prefix: str = "ratelimit:",
         excluded_message_types: set[str] | None = None,
+        max_tracked_keys: int | None = None,
+        enabled: bool = True,
     ):
         super().__init__(next_middleware)
+        self.enabled = enabled
+        if not enabled:
+            # Specialize once so a disabled limiter costs nothing per message
+            self.process = self._noop_process
         self.messages_per_window = messages_per_window
         self.window_seconds = window_seconds
         self.burst_size = burst_size
         self.redis = redis
         self.key_prefix = key_prefix
-        self.excluded_message_types = excluded_message_types or set()
+        self.excluded_message_types = frozenset(excluded_message_types or ())
 
         # Use Redis-based limiter if Redis is provided, otherwise use in-memory
         if redis is not None:
@@ -242,6 +289,7 @@ class RateLimitMiddleware(Middleware):
                 rate=self.messages_per_window,
                 window_seconds=self.window_seconds,
                 burst_size=self.burst_size,
+                max_keys=max_tracked_keys,
             )
 
     async def _check_rate_limit(self, key: str) -> bool:
@@ -252,6 +300,9 @@ class RateLimitMiddleware(Middleware):
             return self._memory_limiter.allow(key)
         return True
 
+    async def _noop_process(self, message, connection, consumer):
+        return message
+
     async def process(self, message, connection, consumer):
         if message.type in self.excluded_message_types:
             return message
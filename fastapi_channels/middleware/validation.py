@@ -1,5 +1,3 @@
-import json
-
 from fastapi_channels.exceptions import ValidationError, create_error_context
 from fastapi_channels.middleware import Middleware
 from fastapi_channels.typed import Message
@@ -12,7 +10,10 @@ class ValidationMiddleware(Middleware):
 
     async def process(self, message: Message, connection, consumer) -> Message | None:
         try:
-            size = len(json.dumps(message.to_dict()))
+            size = message.raw_size
+            if size is None:
+                # Server-originated messages have no inbound frame to measure
+                size = len(message.dumps())
             if size > self.max_message_size:
                 context = create_error_context(
                     user_id=connection.user_id,
@@ -1,11 +1,13 @@
 from fastapi_channels.serializers.base import BaseSerializer
 from fastapi_channels.serializers.json_serializer import JSONSerializer
+from fastapi_channels.serializers.msgpack_serializer import MsgpackSerializer
 from fastapi_channels.serializers.orjson_serializer import ORJSONSerializer
 from fastapi_channels.serializers.pickle_serializer import PickleSerializer
 
 __all__ = [
     "BaseSerializer",
     "JSONSerializer",
+    "MsgpackSerializer",
     "ORJSONSerializer",
     "PickleSerializer",
 ]
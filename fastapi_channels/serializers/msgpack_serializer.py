@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import Any
+
+try:
+    import msgpack  # type: ignore
+except ImportError:
+    msgpack = None
+
+from fastapi_channels.serializers import BaseSerializer
+
+
+class MsgpackSerializer(BaseSerializer):
+    """Serializer backed by msgpack for compact binary payloads."""
+
+    binary = True
+
+    def dumps(self, data: Any) -> bytes:
+        if msgpack is None:
+            raise ImportError("msgpack is not installed")
+        return msgpack.packb(data)
+
+    def loads(self, data: bytes | str) -> Any:
+        if msgpack is None:
+            raise ImportError("msgpack is not installed")
+        return msgpack.unpackb(data)
@@ -4,6 +4,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+from fastapi_channels.utils.encoding import dumps_bytes
+
 
 class ConnectionState(Enum):
     CONNECTING = "connecting"
@@ -18,6 +20,19 @@ class MessagePriority(Enum):
     LOW = "low"
 
 
+# Value -> member lookup, avoiding the Enum call machinery on the parse path
+_PRIORITY_BY_VALUE: dict[str, MessagePriority] = {
+    priority.value: priority for priority in MessagePriority
+}
+# Accepts either a value or a member, so coercion is a single dict.get
+_PRIORITY_COERCE: dict[Any, MessagePriority] = {
+    **_PRIORITY_BY_VALUE,
+    **{priority: priority for priority in MessagePriority},
+}
+_PRIORITY_NORMAL = MessagePriority.NORMAL
+_PRIORITY_NORMAL_VALUE = MessagePriority.NORMAL.value
+
+
 @dataclass(slots=True)
 class Message:
     """Represents a WebSocket message with metadata and delivery options.
@@ -75,6 +90,8 @@ class Message:
     ttl_seconds: float | None = None
     created_at: float = field(default_factory=time.time)
     binary_data: bytes | None = None
+    # Size in bytes of the inbound frame this message was parsed from, if any
+    raw_size: int | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate that data and binary_data are mutually exclusive."""
@@ -98,10 +115,14 @@ class Message:
         >>> msg.is_expired()  # True
         True
 
+        Notes
+        -----
+        Expiry is computed from the current ttl_seconds and created_at on every
+        call. created_at stays a wall-clock timestamp because it is carried across
+        processes in to_dict.
+
         """
-        if self.ttl_seconds is None:
-            return False
-        return (time.time() - self.created_at) > self.ttl_seconds
+        return self.ttl_seconds is not None and time.time() > self.created_at + self.ttl_seconds
 
     def to_dict(self) -> dict[str, Any]:
         """Convert message to dictionary representation for serialization.
@@ -124,9 +145,7 @@ class Message:
             "sender_id": self.sender_id,
             "group": self.group,
             "metadata": self.metadata,
-            "priority": self.priority.value
-            if isinstance(self.priority, MessagePriority)
-            else self.priority,
+            "priority": self.priority.value,
             "ttl_seconds": self.ttl_seconds,
             "created_at": self.created_at,
         }
@@ -134,6 +153,17 @@ class Message:
             result["binary_data"] = base64.b64encode(self.binary_data).decode("utf-8")
         return result
 
+    def dumps(self) -> bytes:
+        """Serialize message straight to JSON bytes.
+
+        Returns
+        -------
+        bytes
+            UTF-8 encoded JSON of to_dict()
+
+        """
+        return dumps_bytes(self.to_dict())
+
     @classmethod
     def from_dict(cls, payload: dict[str, Any]) -> "Message":
         """Create Message instance from dictionary representation.
@@ -156,14 +186,7 @@ class Message:
         <MessagePriority.HIGH: 'high'>
 
         """
-        priority_value = payload.get("priority", MessagePriority.NORMAL.value)
-        priority = (
-            priority_value
-            if isinstance(priority_value, MessagePriority)
-            else MessagePriority(priority_value)
-            if priority_value in MessagePriority._value2member_map_
-            else MessagePriority.NORMAL
-        )
+        priority = _PRIORITY_COERCE.get(payload.get("priority"), _PRIORITY_NORMAL)
 
         binary_data = None
         if "binary_data" in payload:
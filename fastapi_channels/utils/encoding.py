@@ -0,0 +1,60 @@
+"""Fast JSON encoding helpers for the message hot path.
+
+Uses orjson when it is installed and falls back to the standard library json
+module otherwise. Both paths produce compact UTF-8 JSON.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+
+class TextFrame(str):
+    """Encoded JSON text frame that also carries its UTF-8 byte length.
+
+    A group fan-out shares one frame between every recipient, so the length used
+    for connection statistics is computed once instead of per send.
+    """
+
+    nbytes: int
+
+    def __new__(cls, text: str, nbytes: int) -> "TextFrame":
+        frame = super().__new__(cls, text)
+        frame.nbytes = nbytes
+        return frame
+
+
+if orjson is not None:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    JSONDecodeError: type[ValueError] = orjson.JSONDecodeError
+
+    def dumps_bytes(data: Any) -> bytes:
+        """Serialize data to UTF-8 encoded JSON bytes."""
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+    def dumps_text(data: Any) -> str:
+        """Serialize data to a JSON string."""
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(data: bytes | str) -> Any:
+        """Deserialize JSON from bytes or string."""
+        return orjson.loads(data)
+
+else:
+    JSONDecodeError = json.JSONDecodeError
+
+    def dumps_bytes(data: Any) -> bytes:
+        """Serialize data to UTF-8 encoded JSON bytes."""
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def dumps_text(data: Any) -> str:
+        """Serialize data to a JSON string."""
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+    def loads(data: bytes | str) -> Any:
+        """Deserialize JSON from bytes or string."""
+        return json.loads(data)
@@ -1,4 +1,5 @@
 import asyncio
+import time
 from unittest.mock import Mock
 
 import pytest
@@ -78,6 +79,18 @@ class TestChatConsumer:
         assert msg2.type == msg.type
         assert msg2.data == msg.data
 
+    def test_message_expiry(self):
+        """Test TTL expiry, including messages rebuilt from a serialized dict"""
+        assert not Message(type="test", data=None).is_expired()
+        assert not Message(type="test", data=None, ttl_seconds=60.0).is_expired()
+
+        stale = Message(type="test", data=None, ttl_seconds=1.0, created_at=time.time() - 5)
+        assert stale.is_expired()
+        assert Message.from_dict(stale.to_dict()).is_expired()
+
+        stale.ttl_seconds = 60.0
+        assert not stale.is_expired()
+
     def test_memory_backend(self):
         """Test MemoryBackend functionality"""
         backend = MemoryBackend()
@@ -150,6 +163,29 @@ class TestChatConsumer:
         finally:
             loop.close()
 
+    def test_validation_middleware_uses_raw_size(self):
+        """Inbound messages are size-checked against their raw frame length"""
+        from unittest.mock import Mock
+
+        from fastapi_channels.exceptions import ValidationError
+
+        middleware = ValidationMiddleware(max_message_size=100)
+        connection = Mock()
+        connection.channel_name = "test_conn"
+        connection.user_id = "test_user"
+
+        message = Message(type="test", data={"text": "short"})
+        message.raw_size = 101
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        try:
+            with pytest.raises(ValidationError):
+                loop.run_until_complete(middleware.process(message, connection, Mock()))
+        finally:
+            loop.close()
+
     def test_rate_limit_middleware(self):
         """Test RateLimitMiddleware functionality"""
         from unittest.mock import Mock
@@ -177,6 +213,478 @@ class TestChatConsumer:
         finally:
             loop.close()
 
+    def test_disabled_rate_limit_middleware(self):
+        """Disabled RateLimitMiddleware passes every message through"""
+        from unittest.mock import Mock
+
+        from fastapi_channels.middleware import RateLimitMiddleware
+
+        middleware = RateLimitMiddleware(enabled=False, messages_per_window=1, burst_size=1)
+        message = Message(type="chat_message", data={"text": "test"})
+        connection = Mock()
+        connection.channel_name = "test_conn"
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        try:
+            for _ in range(3):
+                result = loop.run_until_complete(middleware.process(message, connection, Mock()))
+                assert result == message
+        finally:
+            loop.close()
+
+    def test_middleware_stack_reassignment_and_custom_call(self):
+        """Assigning middleware_stack re-flattens it, and a custom __call__ is kept whole"""
+        from fastapi_channels.middleware import Middleware
+
+        seen = []
+
+        class Tag(Middleware):
+            def __init__(self, name, next_middleware=None):
+                super().__init__(next_middleware)
+                self.name = name
+
+            async def process(self, message, connection, consumer):
+                seen.append(self.name)
+                return message
+
+        class Wrapping(Tag):
+            async def __call__(self, message, connection, consumer):
+                seen.append("wrap")
+                return await super().__call__(message, connection, consumer)
+
+        received = []
+
+        class CapturingConsumer(ChatConsumer):
+            async def receive(self, message):
+                received.append(message)
+
+        connection = Mock()
+        connection.channel_name = "test_conn"
+        connection.user_id = "test_user"
+        connection.bytes_received = 0
+        consumer = CapturingConsumer(
+            connection=connection, manager=Mock(), middleware_stack=Tag("a")
+        )
+        consumer.middleware_stack = Tag("b") | Wrapping("c") | Tag("d")
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        try:
+            loop.run_until_complete(consumer.handle_message('{"type": "chat", "data": 1}'))
+        finally:
+            loop.close()
+
+        assert seen == ["b", "wrap", "c", "d"]
+        assert len(received) == 1
+
+    def test_token_bucket_rate_limiter(self):
+        """Token bucket allows a burst, then denies until tokens refill"""
+        from fastapi_channels.middleware.rate_limit import TokenBucketRateLimiter
+
+        limiter = TokenBucketRateLimiter(rate=1, window_seconds=60, burst_size=3)
+
+        assert [limiter.allow("conn") for _ in range(4)] == [True, True, True, False]
+        assert limiter.allow("other_conn")
+
+    def test_token_bucket_rate_limiter_evicts_lru_keys(self):
+        """Limiter tracks at most max_keys buckets, evicting the least recently used"""
+        from fastapi_channels.middleware.rate_limit import TokenBucketRateLimiter
+
+        limiter = TokenBucketRateLimiter(rate=1, window_seconds=60, burst_size=1, max_keys=2)
+        limiter.allow("a")
+        limiter.allow("b")
+        limiter.allow("a")
+        limiter.allow("c")
+
+        assert set(limiter._tokens) == {"a", "c"}
+
+    def test_rate_limit_max_keys_follows_settings(self, monkeypatch):
+        """The tracked-key cap is read from the configured MAX_TOTAL_CONNECTIONS"""
+        from fastapi_channels.middleware import RateLimitMiddleware
+
+        monkeypatch.setenv("MAX_TOTAL_CONNECTIONS", "50")
+
+        assert RateLimitMiddleware()._memory_limiter.max_keys == 100
+        assert RateLimitMiddleware(max_tracked_keys=7)._memory_limiter.max_keys == 7
+
+        with pytest.raises(ValueError, match="max_keys"):
+            RateLimitMiddleware(max_tracked_keys=0)
+
+    def test_send_many_batches_into_one_frame(self):
+        """send_many writes a JSON array (or NDJSON) of envelopes in one send_text call"""
+        import json
+        from unittest.mock import AsyncMock
+
+        connection = Mock()
+        connection.channel_name = "test_conn"
+        connection.user_id = "test_user"
+        connection.message_count = 0
+        connection.bytes_sent = 0
+        connection.websocket.send_text = AsyncMock()
+        consumer = ChatConsumer(connection=connection, manager=Mock())
+
+        messages = [Message(type="a", data=1), Message(type="b", data=2)]
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        try:
+            loop.run_until_complete(consumer.send_many(messages))
+            frame = connection.websocket.send_text.await_args.args[0]
+            assert [item["type"] for item in json.loads(frame)] == ["a", "b"]
+            assert connection.message_count == 2
+
+            loop.run_until_complete(consumer.send_many(messages, ndjson=True))
+            frame = connection.websocket.send_text.await_args.args[0]
+            assert [json.loads(line)["data"] for line in frame.split("\n")] == [1, 2]
+            assert connection.websocket.send_text.await_count == 2
+        finally:
+            loop.close()
+
+    def test_json_as_bytes_sends_binary_frames(self):
+        """Consumers opting into json_as_bytes send encoded JSON as binary frames"""
+        import json
+        from unittest.mock import AsyncMock
+
+        class BinaryConsumer(ChatConsumer):
+            json_as_bytes = True
+
+        connection = Mock()
+        connection.channel_name = "test_conn"
+        connection.user_id = "test_user"
+        connection.message_count = 0
+        connection.bytes_sent = 0
+        connection.websocket.send_bytes = AsyncMock()
+        connection.websocket.send_text = AsyncMock()
+        consumer = BinaryConsumer(connection=connection, manager=Mock())
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        try:
+            loop.run_until_complete(consumer.send(Message(type="a", data=1)))
+            loop.run_until_complete(consumer.send_json({"type": "b"}))
+        finally:
+            loop.close()
+
+        frames = [call.args[0] for call in connection.websocket.send_bytes.await_args_list]
+        assert [json.loads(frame)["type"] for frame in frames] == ["a", "b"]
+        connection.websocket.send_text.assert_not_awaited()
+
+    def test_msgpack_codec_round_trip(self):
+        """A binary codec decodes binary frames as envelopes and encodes sends"""
+        msgpack = pytest.importorskip("msgpack")
+        from unittest.mock import AsyncMock
+
+        from fastapi_channels.consumer import BaseConsumer
+        from fastapi_channels.serializers import MsgpackSerializer
+
+        received = []
+
+        class CapturingConsumer(BaseConsumer):
+            async def connect(self):
+                pass
+
+            async def on_disconnect(self, code):
+                pass
+
+            async def receive(self, message):
+                received.append(message)
+
+        connection = Mock()
+        connection.channel_name = "test_conn"
+        connection.user_id = "test_user"
+        connection.bytes_received = 0
+        connection.message_count = 0
+        connection.bytes_sent = 0
+        connection.websocket.send_bytes = AsyncMock()
+        consumer = CapturingConsumer(
+            connection=connection, manager=Mock(), codec=MsgpackSerializer()
+        )
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        try:
+            frame = msgpack.packb({"type": "chat", "data": {"text": "hi"}})
+            loop.run_until_complete(consumer.handle_message(binary=frame))
+            loop.run_until_complete(consumer.send(Message(type="ack", data=1)))
+        finally:
+            loop.close()
+
+        assert received[0].type == "chat"
+        assert received[0].data == {"text": "hi"}
+        assert received[0].raw_size == len(frame)
+        sent = msgpack.unpackb(connection.websocket.send_bytes.await_args.args[0])
+        assert (sent["type"], sent["data"]) == ("ack", 1)
+
+    def test_text_codec_uses_text_frames(self):
+        """A non-binary codec sends text frames and leaves binary frames as binary"""
+        pytest.importorskip("orjson")
+        import json
+        from unittest.mock import AsyncMock
+
+        from fastapi_channels.consumer import BaseConsumer
+        from fastapi_channels.serializers import ORJSONSerializer
+
+        received = []
+
+        class CapturingConsumer(BaseConsumer):
+            async def connect(self):
+                pass
+
+            async def on_disconnect(self, code):
+                pass
+
+            async def receive(self, message):
+                received.append(message)
+
+        connection = Mock()
+        connection.channel_name = "test_conn"
+        connection.user_id = "test_user"
+        connection.bytes_received = 0
+        connection.message_count = 0
+        connection.bytes_sent = 0
+        connection.websocket.send_text = AsyncMock()
+        connection.websocket.send_bytes = AsyncMock()
+        consumer = CapturingConsumer(
+            connection=connection, manager=Mock(), codec=ORJSONSerializer()
+        )
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        try:
+            loop.run_until_complete(consumer.handle_message('{"type":"chat","data":1}'))
+            loop.run_until_complete(consumer.handle_message(binary=b'{"type":"x","data":1}'))
+            loop.run_until_complete(consumer.send(Message(type="ack", data=1)))
+        finally:
+            loop.close()
+
+        assert (received[0].type, received[0].data) == ("chat", 1)
+        assert received[1].type == "binary"
+        sent = connection.websocket.send_text.await_args.args[0]
+        assert isinstance(sent, str)
+        assert json.loads(sent)["type"] == "ack"
+        assert connection.bytes_sent == len(sent.encode())
+        connection.websocket.send_bytes.assert_not_awaited()
+
+    def test_unsafe_codec_rejected(self):
+        """Codecs that can execute code on decode are refused at construction"""
+        from fastapi_channels.consumer import BaseConsumer
+        from fastapi_channels.serializers import PickleSerializer
+
+        class PlainConsumer(BaseConsumer):
+            async def connect(self):
+                pass
+
+            async def on_disconnect(self, code):
+                pass
+
+            async def receive(self, message):
+                pass
+
+        with pytest.raises(ValueError, match="PickleSerializer"):
+            PlainConsumer(connection=Mock(), manager=Mock(), codec=PickleSerializer())
+
+    def test_outbound_queue_coalesces_sends(self):
+        """Queued sends are drained by one task and merged into a single frame"""
+        import json
+        from unittest.mock import AsyncMock
+
+        from fastapi_channels.consumer import BaseConsumer
+
+        class BatchingConsumer(BaseConsumer):
+            outbound_batch_size = 8
+
+            async def connect(self):
+                pass
+
+            async def on_disconnect(self, code):
+                pass
+
+            async def receive(self, message):
+                pass
+
+        connection = Mock()
+        connection.channel_name = "test_conn"
+        connection.user_id = "test_user"
+        connection.message_count = 0
+        connection.bytes_sent = 0
+        connection.websocket.send_text = AsyncMock()
+        consumer = BatchingConsumer(connection=connection, manager=AsyncMock())
+
+        async def scenario():
+            for n in range(3):
+                await consumer.send(Message(type="n", data=n))
+            await asyncio.sleep(0.01)
+            await consumer.disconnect()
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        try:
+            loop.run_until_complete(scenario())
+        finally:
+            loop.close()
+
+        frame = connection.websocket.send_text.await_args.args[0]
+        assert [item["data"] for item in json.loads(frame)] == [0, 1, 2]
+        assert connection.websocket.send_text.await_count == 1
+        assert connection.message_count == 3
+        assert consumer._sender_task is None
+
+    def test_outbound_queue_keeps_order_and_closes(self):
+        """Direct writes wait for queued sends, and send() after disconnect is dropped"""
+        import json
+        from unittest.mock import AsyncMock
+
+        from fastapi_channels.consumer import BaseConsumer
+
+        class BatchingConsumer(BaseConsumer):
+            outbound_batch_size = 8
+
+            async def connect(self):
+                pass
+
+            async def on_disconnect(self, code):
+                pass
+
+            async def receive(self, message):
+                pass
+
+        connection = Mock()
+        connection.channel_name = "test_conn"
+        connection.user_id = "test_user"
+        connection.message_count = 0
+        connection.bytes_sent = 0
+        connection.websocket.send_text = AsyncMock()
+        consumer = BatchingConsumer(connection=connection, manager=AsyncMock())
+
+        async def scenario():
+            await consumer.send(Message(type="queued", data=1))
+            await consumer.send_json({"type": "direct"})
+            await consumer.disconnect()
+            await consumer.send(Message(type="late", data=2))
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        try:
+            loop.run_until_complete(scenario())
+        finally:
+            loop.close()
+
+        frames = [call.args[0] for call in connection.websocket.send_text.await_args_list]
+        assert [json.loads(frame)["type"] for frame in frames] == ["queued", "direct"]
+        assert consumer._sender_task is None
+
+    def test_outbound_sender_failure_drops_later_sends(self):
+        """A failed write stops the sender for good instead of restarting per send"""
+        from unittest.mock import AsyncMock
+
+        from fastapi_channels.consumer import BaseConsumer
+
+        class BatchingConsumer(BaseConsumer):
+            outbound_batch_size = 8
+
+            async def connect(self):
+                pass
+
+            async def on_disconnect(self, code):
+                pass
+
+            async def receive(self, message):
+                pass
+
+        connection = Mock()
+        connection.channel_name = "test_conn"
+        connection.user_id = "test_user"
+        connection.websocket.send_text = AsyncMock(side_effect=RuntimeError("closed"))
+        consumer = BatchingConsumer(connection=connection, manager=AsyncMock())
+
+        async def scenario():
+            await consumer.send(Message(type="first", data=1))
+            await asyncio.sleep(0.01)
+            for n in range(3):
+                await consumer.send(Message(type="late", data=n))
+            await asyncio.sleep(0.01)
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        try:
+            loop.run_until_complete(scenario())
+        finally:
+            loop.close()
+
+        assert connection.websocket.send_text.await_count == 1
+        assert consumer._out_queue.empty()
+
+    def test_handle_message_maps_envelope_fields(self):
+        """handle_message fills Message fields from both plain and full envelopes"""
+        from fastapi_channels.typed import MessagePriority
+
+        received = []
+
+        class CapturingConsumer(ChatConsumer):
+            async def receive(self, message):
+                received.append(message)
+
+        connection = Mock()
+        connection.channel_name = "test_conn"
+        connection.user_id = "test_user"
+        connection.bytes_received = 0
+        consumer = CapturingConsumer(connection=connection, manager=Mock())
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        try:
+            loop.run_until_complete(consumer.handle_message(json_str='{"type":"a","data":1}'))
+            loop.run_until_complete(
+                consumer.handle_message(
+                    json_str=b'{"type":"b","data":2,"metadata":{"k":"v"},'
+                    b'"priority":"high","ttl_seconds":5}'
+                )
+            )
+        finally:
+            loop.close()
+
+        plain, full = received
+        assert (plain.type, plain.data, plain.sender_id) == ("a", 1, "test_conn")
+        assert plain.priority is MessagePriority.NORMAL
+        assert (full.type, full.data, full.sender_id, full.group) == ("b", 2, "test_conn", None)
+        assert full.metadata == {"k": "v"}
+        assert full.priority is MessagePriority.HIGH
+        assert full.ttl_seconds == 5
+        assert connection.bytes_received == plain.raw_size + full.raw_size
+
+    def test_pong_frames_skip_parsing(self):
+        """Bare pong frames update the heartbeat and never reach receive"""
+        from unittest.mock import AsyncMock
+
+        connection = Mock()
+        connection.channel_name = "test_conn"
+        connection.user_id = "test_user"
+        consumer = ChatConsumer(connection=connection, manager=Mock())
+        consumer.receive = AsyncMock()
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        try:
+            loop.run_until_complete(consumer.handle_message(json_str='{"type":"pong"}'))
+            loop.run_until_complete(consumer.handle_message(json_str=b'{"type":"pong"}'))
+            loop.run_until_complete(consumer.handle_message(json_str='{"type":"pong","t":1}'))
+        finally:
+            loop.close()
+
+        assert connection.update_heartbeat.call_count == 3
+        consumer.receive.assert_not_awaited()
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
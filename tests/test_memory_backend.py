@@ -0,0 +1,108 @@
+import json
+
+import pytest
+
+from fastapi_channels.backends import MemoryBackend
+
+
+@pytest.mark.asyncio
+async def test_group_send_delivers_shared_message():
+    """Every channel in the group receives the same pre-encoded frame."""
+    backend = MemoryBackend()
+    for channel in ("ch1", "ch2", "ch3"):
+        await backend.subscribe(channel)
+        await backend.group_add("room", channel)
+
+    message = {"type": "chat", "text": "hello"}
+    await backend.group_send("room", message, exclude_channel="ch3")
+
+    first = await backend.receive("ch1", timeout=0.1)
+    second = await backend.receive("ch2", timeout=0.1)
+    assert json.loads(first) == message
+    assert second is first
+    with pytest.raises(TimeoutError):
+        await backend.receive("ch3", timeout=0.05)
+
+
+@pytest.mark.asyncio
+async def test_group_send_unknown_group_is_noop():
+    backend = MemoryBackend()
+    await backend.group_send("missing", {"type": "chat"})
+
+
+@pytest.mark.asyncio
+async def test_subscribers_have_independent_queues():
+    """Each subscriber gets its own queue and unsubscribing one keeps the other."""
+    backend = MemoryBackend()
+    first = await backend.subscribe("ch")
+    second = await backend.subscribe("ch")
+    assert first is not second
+
+    await backend.publish("ch", {"n": 1})
+    assert await backend.get_message("ch", timeout=0.1, queue=first) == {"n": 1}
+    assert await backend.get_message("ch", timeout=0.1, queue=second) == {"n": 1}
+
+    with pytest.raises(ValueError):
+        await backend.get_message("ch", timeout=0.1)
+
+    await backend.unsubscribe("ch", first)
+    assert backend.listeners["ch"] == {second}
+
+    await backend.unsubscribe("ch", second)
+    assert "ch" not in backend.listeners
+
+
+@pytest.mark.asyncio
+async def test_publish_skips_full_queue():
+    """A full subscriber queue drops the message without blocking the publisher."""
+    backend = MemoryBackend(max_queue_depth=1)
+    queue = await backend.subscribe("ch")
+
+    await backend.publish("ch", {"n": 1})
+    await backend.publish("ch", {"n": 2})
+
+    assert queue.qsize() == 1
+    assert queue.get_nowait() == {"n": 1}
+
+
+@pytest.mark.asyncio
+async def test_group_send_raw_shares_decoded_frame():
+    """Pre-encoded payloads are decoded once and shared by every subscriber."""
+    backend = MemoryBackend()
+    assert backend.supports_raw_broadcast()
+    for channel in ("ch1", "ch2"):
+        await backend.subscribe(channel)
+        await backend.group_add("room", channel)
+
+    await backend.group_send_raw("room", b'{"type":"chat"}', exclude_channel="ch2")
+
+    assert await backend.receive("ch1", timeout=0.1) == '{"type":"chat"}'
+    with pytest.raises(TimeoutError):
+        await backend.receive("ch2", timeout=0.05)
+
+
+@pytest.mark.asyncio
+async def test_group_send_many_preserves_order():
+    backend = MemoryBackend()
+    await backend.subscribe("ch")
+    await backend.group_add("room", "ch")
+
+    await backend.group_send_many("room", [{"n": 1}, {"n": 2}])
+
+    assert json.loads(await backend.receive("ch", timeout=0.1)) == {"n": 1}
+    assert json.loads(await backend.receive("ch", timeout=0.1)) == {"n": 2}
+
+
+@pytest.mark.asyncio
+async def test_group_frame_carries_byte_length():
+    """Text frames record their UTF-8 length once for every recipient."""
+    backend = MemoryBackend()
+    await backend.subscribe("ch")
+    await backend.group_add("room", "ch")
+
+    await backend.group_send("room", {"text": "héllo"})
+    await backend.group_send_raw("room", '{"text":"ünï"}'.encode())
+
+    for _ in range(2):
+        frame = await backend.receive("ch", timeout=0.1)
+        assert frame.nbytes == len(frame.encode())
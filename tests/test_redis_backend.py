@@ -1,6 +1,7 @@
 # pyright: reportMissingImports=false
 
 import asyncio
+import json
 import uuid
 
 import pytest
@@ -8,6 +9,7 @@ import pytest_asyncio
 from redis.asyncio import Redis
 
 from fastapi_channels.backends import RedisBackend
+from fastapi_channels.serializers import JSONSerializer, ORJSONSerializer, PickleSerializer
 
 
 @pytest_asyncio.fixture(scope="module")
@@ -32,6 +34,7 @@ async def backend_factory(redis_url: str):
         registry_expiry: int | None = 30,
         group_expiry: int | None = 30,
         channel_prefix: str | None = None,
+        serializer=None,
     ):
         prefix = channel_prefix or f"test:ws:{uuid.uuid4().hex}:"
         backend = RedisBackend(
@@ -39,6 +42,7 @@ async def backend_factory(redis_url: str):
             channel_prefix=prefix,
             registry_expiry=registry_expiry,
             group_expiry=group_expiry,
+            serializer=serializer,
         )
         await backend.connect()
         await backend.flush()
@@ -47,6 +51,25 @@ async def backend_factory(redis_url: str):
     yield _make_backend
 
 
+async def _published(redis_url: str, backend, channels, send) -> dict[str, list[bytes]]:
+    """Run send() while subscribed to the channels and return the raw payloads per channel."""
+    client = Redis.from_url(redis_url)
+    pubsub = client.pubsub()
+    received: dict[str, list[bytes]] = {channel: [] for channel in channels}
+    try:
+        await pubsub.subscribe(*(f"{backend.channel_prefix}{channel}" for channel in channels))
+        for _ in channels:
+            await pubsub.get_message(timeout=1.0)
+        await send()
+        while message := await pubsub.get_message(ignore_subscribe_messages=True, timeout=0.5):
+            channel = message["channel"].decode().removeprefix(backend.channel_prefix)
+            received[channel].append(message["data"])
+    finally:
+        await pubsub.aclose()
+        await client.aclose()
+    return received
+
+
 @pytest.mark.asyncio
 async def test_cleanup_stale_connections_by_server_id(backend_factory):
     """Connections from other servers should be removed."""
@@ -217,3 +240,106 @@ async def test_concurrent_cleanup_safe(backend_factory):
         await backend_b.flush()
         await backend_a.cleanup()
         await backend_b.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_group_send_many_preserves_order_per_channel(backend_factory, redis_url):
+    """Every channel receives the whole batch, in order."""
+    backend = await backend_factory()
+    try:
+        for channel in ("ch1", "ch2"):
+            await backend.group_add("room", channel)
+        messages = [{"n": n} for n in range(5)]
+
+        received = await _published(
+            redis_url, backend, ["ch1", "ch2"], lambda: backend.group_send_many("room", messages)
+        )
+
+        for channel in ("ch1", "ch2"):
+            assert [json.loads(data) for data in received[channel]] == messages
+    finally:
+        await backend.flush()
+        await backend.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_group_send_many_excludes_channel(backend_factory, redis_url):
+    backend = await backend_factory()
+    try:
+        for channel in ("ch1", "ch2"):
+            await backend.group_add("room", channel)
+
+        received = await _published(
+            redis_url,
+            backend,
+            ["ch1", "ch2"],
+            lambda: backend.group_send_many("room", [{"n": 1}, {"n": 2}], exclude_channel="ch2"),
+        )
+
+        assert [json.loads(data) for data in received["ch1"]] == [{"n": 1}, {"n": 2}]
+        assert received["ch2"] == []
+    finally:
+        await backend.flush()
+        await backend.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_group_send_many_empty_list_publishes_nothing(backend_factory, redis_url):
+    backend = await backend_factory()
+    try:
+        await backend.group_add("room", "ch1")
+
+        received = await _published(
+            redis_url, backend, ["ch1"], lambda: backend.group_send_many("room", [])
+        )
+
+        assert received["ch1"] == []
+    finally:
+        await backend.flush()
+        await backend.cleanup()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("serializer_cls", [JSONSerializer, ORJSONSerializer])
+async def test_group_send_raw_publishes_payload_as_is(backend_factory, redis_url, serializer_cls):
+    """JSON serializers publish the pre-encoded bytes without re-serializing."""
+    if serializer_cls is ORJSONSerializer:
+        pytest.importorskip("orjson")
+    backend = await backend_factory(serializer=serializer_cls())
+    try:
+        assert backend.supports_raw_broadcast()
+        await backend.group_add("room", "ch1")
+        # Non-canonical spacing shows the bytes were not decoded and re-encoded
+        payload = b'{"type": "chat",  "n": 1}'
+
+        received = await _published(
+            redis_url, backend, ["ch1"], lambda: backend.group_send_raw("room", payload)
+        )
+
+        assert received["ch1"] == [payload]
+    finally:
+        await backend.flush()
+        await backend.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_group_send_raw_reserializes_for_pickle(backend_factory, redis_url):
+    """Serializers that cannot read JSON get the payload decoded and re-serialized."""
+    backend = await backend_factory(serializer=PickleSerializer())
+    try:
+        assert not backend.supports_raw_broadcast()
+        await backend.group_add("room", "ch1")
+
+        received = await _published(
+            redis_url,
+            backend,
+            ["ch1"],
+            lambda: backend.group_send_raw("room", b'{"type": "chat", "n": 1}'),
+        )
+
+        assert [backend.serializer.loads(data) for data in received["ch1"]] == [
+            {"type": "chat", "n": 1}
+        ]
+    finally:
+        await backend.flush()
+        await backend.cleanup()